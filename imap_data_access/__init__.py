@@ -5,16 +5,27 @@ heliosphere. This package contains the data access tools for the IMAP mission. I
 provides a convenient way to query the IMAP data archive and download data files.
 """
 
+import importlib
 import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from imap_data_access.file_validation import ScienceFilePath, SPICEFilePath
-from imap_data_access.io import download, query, upload
+if TYPE_CHECKING:
+    from imap_data_access.file_validation import ScienceFilePath, SPICEFilePath
+    from imap_data_access.io import (
+        download,
+        download_many,
+        query,
+        upload,
+        upload_many,
+    )
 
 __all__ = [
     "query",
     "download",
+    "download_many",
     "upload",
+    "upload_many",
     "ScienceFilePath",
     "SPICEFilePath",
     "VALID_INSTRUMENTS",
@@ -24,12 +35,48 @@ __all__ = [
 ]
 __version__ = "0.10.1"
 
+# The public API is imported lazily on first access (PEP 562) so that
+# importing the package, e.g. for ``imap-data-access --help``, does not
+# pull in the network and validation modules until they are needed.
+_LAZY_ATTRIBUTES = {
+    "download": "imap_data_access.io",
+    "download_many": "imap_data_access.io",
+    "query": "imap_data_access.io",
+    "upload": "imap_data_access.io",
+    "upload_many": "imap_data_access.io",
+    "ScienceFilePath": "imap_data_access.file_validation",
+    "SPICEFilePath": "imap_data_access.file_validation",
+}
+_LAZY_SUBMODULES = {"file_validation", "io"}
+
+
+def __getattr__(name: str):
+    """Import the public API and submodules on first access."""
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+        # Store the value so later lookups skip this function entirely
+        globals()[name] = value
+        return value
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """List the module attributes, including the lazily imported ones."""
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | _LAZY_SUBMODULES)
+
 
 config = {
     "DATA_ACCESS_URL": os.getenv("IMAP_DATA_ACCESS_URL")
     or "https://api.dev.imap-mission.com",
-    "DATA_DIR": Path(os.getenv("IMAP_DATA_DIR") or Path.cwd() / "data"),
+    # Resolved once at import so later working directory changes don't move it
+    "DATA_DIR": Path(os.getenv("IMAP_DATA_DIR") or Path.cwd() / "data").resolve(),
     "API_KEY": os.getenv("IMAP_API_KEY"),
+    # The query cache settings are only interpreted when a query is made,
+    # so a bad value can't stop the package from being imported
+    "QUERY_CACHE_TTL": os.getenv("IMAP_QUERY_CACHE_TTL"),
+    "QUERY_CACHE_DIR": None,
 }
 """Settings configuration dictionary.
 
@@ -37,44 +84,56 @@ DATA_ACCESS_URL : This is the URL of the data access API.
 DATA_DIR : This is where the file data is stored and organized by instrument and level.
     The default location is a 'data/' folder in the current working directory,
     "but this can be set on the command line using the --data-dir option, or through
-    the environment variable IMAP_DATA_DIR.
+    the environment variable IMAP_DATA_DIR. The path is resolved to an absolute
+    path once when the package is imported.
 API_KEY : This is the API key used to authenticate with the data access API.
     It can be set on the command line using the --api-key option, or through the
     environment variable IMAP_API_KEY. It is only necessary for uploading files.
+QUERY_CACHE_TTL : Number of seconds that query responses are cached on disk for.
+    Caching is disabled by default, it can be enabled through the environment
+    variable IMAP_QUERY_CACHE_TTL.
+QUERY_CACHE_DIR : This is where cached query responses are stored. If it is not
+    set, 'imap_data_access/queries/' in the user's cache directory is used.
 """
 
 
-VALID_INSTRUMENTS = {
-    "codice",
-    "glows",
-    "hit",
-    "hi",
-    "idex",
-    "lo",
-    "mag",
-    "swapi",
-    "swe",
-    "ultra",
-}
+# The valid values are frozensets so they can't be modified at runtime
+# and membership checks against them are constant time
+VALID_INSTRUMENTS = frozenset(
+    {
+        "codice",
+        "glows",
+        "hit",
+        "hi",
+        "idex",
+        "lo",
+        "mag",
+        "swapi",
+        "swe",
+        "ultra",
+    }
+)
 
-VALID_DATALEVELS = {
-    "l0",
-    "l1",
-    "l1a",
-    "l1b",
-    "l1c",
-    "l1ca",
-    "l1cb",
-    "l1d",
-    "l2",
-    "l3",
-    "l3a",
-    "l3b",
-    "l3c",
-    "l3d",
-}
+VALID_DATALEVELS = frozenset(
+    {
+        "l0",
+        "l1",
+        "l1a",
+        "l1b",
+        "l1c",
+        "l1ca",
+        "l1cb",
+        "l1d",
+        "l2",
+        "l3",
+        "l3a",
+        "l3b",
+        "l3c",
+        "l3d",
+    }
+)
 
-VALID_FILE_EXTENSION = {"pkts", "cdf"}
+VALID_FILE_EXTENSION = frozenset({"pkts", "cdf"})
 
 FILENAME_CONVENTION = (
     "<mission>_<instrument>_<datalevel>_<descriptor>_"
@@ -10,30 +10,56 @@ Use
 ---
     imap-data-access <command> [<args>]
     imap-data-access --help
-    imap-data-access download <file_path>
+    imap-data-access download <file_path> [<file_path> ...]
     imap-data-access query <query-parameters>
     imap-data-access upload <file_path>
 """
 
 import argparse
+import functools
+import json
 import logging
-import os
+import sys
 from pathlib import Path
 
 import imap_data_access
-from imap_data_access.file_validation import ScienceFilePath
+
+# Subcommands of the command line interface
+_COMMANDS = frozenset({"download", "query", "upload"})
+
+# Namespace arguments that are passed through to the query API
+_VALID_QUERY_ARGS = frozenset(
+    {
+        "instrument",
+        "data_level",
+        "descriptor",
+        "start_date",
+        "end_date",
+        "repointing",
+        "version",
+        "extension",
+        "filename",
+    }
+)
 
 
 def _download_parser(args: argparse.Namespace):
-    """Download a file from the IMAP SDC.
+    """Download one or more files from the IMAP SDC.
+
+    Multiple files are downloaded concurrently, with at most
+    ``args.concurrency`` downloads in flight at once.
 
     Parameters
     ----------
     args : argparse.Namespace
         An object containing the parsed arguments and their values
     """
-    output_path = imap_data_access.download(args.file_path)
-    print(f"Successfully downloaded the file to: {output_path}")
+    output_paths = imap_data_access.download_many(
+        args.file_path, max_workers=args.concurrency
+    )
+    if not args.no_progress:
+        for output_path in output_paths:
+            print(f"Successfully downloaded the file to: {output_path}")
 
 
 def _print_query_results_table(query_results: list[dict]):
@@ -60,39 +86,10 @@ def _print_query_results_table(query_results: list[dict]):
         "Filename",
     ]
 
-    # Calculate the maximum width for each column based on the header and the data
-    column_widths = {}
-    for header in headers[:-1]:
-        column_widths[header] = max(
-            len(header),
-            *(len(str(item.get(header.lower(), ""))) for item in query_results),
-        )
-        # Calculate the maximum width for each column based on the header and the data
-
-        column_widths["Filename"] = max(
-            len("Filename"),
-            *(
-                len(os.path.basename(item.get("file_path", "")))
-                for item in query_results
-            ),
-        )
-
-    # Create the format string dynamically based on the number of columns
-    format_string = (
-        "| "
-        + " | ".join([f"{{:<{column_widths[header]}}}" for header in headers])
-        + " |"
-    )
-
-    # Add hyphens for a separator between header and data
-    hyphens = "|" + "-" * (sum(column_widths.values()) + 3 * len(headers) - 1) + "|"
-    print(hyphens)
-
-    # Print header
-    print(format_string.format(*headers))
-    print(hyphens)
-
-    # Print data
+    # Gather the values for each row and the maximum width of each column
+    # based on the header and the data in a single pass over the results
+    column_widths = {header: len(header) for header in headers}
+    rows = []
     for item in query_results:
         values = [
             str(item.get("instrument", "")),
@@ -101,12 +98,32 @@ def _print_query_results_table(query_results: list[dict]):
             str(item.get("start_date", "")),
             str(item.get("repointing", "")) or "",
             str(item.get("version", "")),
-            os.path.basename(item.get("file_path", "")),
+            # The archive always returns "/" separated paths
+            item.get("file_path", "").rpartition("/")[2],
         ]
-        print(format_string.format(*values))
+        for header, value in zip(headers, values):
+            column_widths[header] = max(column_widths[header], len(value))
+        rows.append(values)
+
+    # Left-justify each value to its column width and join the columns
+    pads = [column_widths[header] for header in headers]
+
+    def _format_row(values: list[str]) -> str:
+        return (
+            "| "
+            + " | ".join([value.ljust(pad) for value, pad in zip(values, pads)])
+            + " |"
+        )
 
+    # Add hyphens for a separator between header and data
+    hyphens = "|" + "-" * (sum(pads) + 3 * len(headers) - 1) + "|"
+
+    # Assemble the whole table and write it out at once
+    lines = [hyphens, _format_row(headers), hyphens]
+    lines.extend([_format_row(values) for values in rows])
     # Close the table
-    print(hyphens)
+    lines.append(hyphens)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def _query_parser(args: argparse.Namespace):
@@ -118,22 +135,10 @@ def _query_parser(args: argparse.Namespace):
         An object containing the parsed arguments and their values
     """
     # Filter to get the arguments of interest from the namespace
-    valid_args = [
-        "instrument",
-        "data_level",
-        "descriptor",
-        "start_date",
-        "end_date",
-        "repointing",
-        "version",
-        "extension",
-        "filename",
-    ]
-
     query_params = {
         key: value
         for key, value in vars(args).items()
-        if key in valid_args and value is not None
+        if key in _VALID_QUERY_ARGS and value is not None
     }
 
     # Checking to see if a filename was passed.
@@ -142,7 +147,7 @@ def _query_parser(args: argparse.Namespace):
         if query_params:
             raise TypeError("Too many arguments, '--filename' should be ran by itself")
 
-        file_path = ScienceFilePath(args.filename)
+        file_path = imap_data_access.ScienceFilePath.from_name(args.filename)
         query_params = {
             "instrument": file_path.instrument,
             "data_level": file_path.data_level,
@@ -158,8 +163,9 @@ def _query_parser(args: argparse.Namespace):
     if args.output_format == "table":
         _print_query_results_table(query_results)
     elif args.output_format == "json":
-        # Dump the content directly
-        print(query_results)
+        # Stream the results out as JSON rather than building one large string
+        json.dump(query_results, sys.stdout)
+        sys.stdout.write("\n")
 
 
 def _upload_parser(args: argparse.Namespace):
@@ -174,11 +180,24 @@ def _upload_parser(args: argparse.Namespace):
     print("Successfully uploaded the file to the IMAP SDC")
 
 
-# PLR0915: too many statements
-def main():  # noqa: PLR0915
-    """Parse the command line arguments.
+@functools.cache
+def _build_parser(commands: frozenset[str]) -> argparse.ArgumentParser:
+    """Build the command line argument parser.
 
-    Run the command line interface to the IMAP Data Access API.
+    All of the subcommands are added so that they show up in the help menu,
+    but only the arguments of the requested subcommands are added to keep
+    the startup time down. The parser is only built once per process for
+    each set of subcommands and then reused.
+
+    Parameters
+    ----------
+    commands : frozenset of str
+        The subcommands to add the arguments for
+
+    Returns
+    -------
+    argparse.ArgumentParser
+        The parser for the command line interface
     """
     api_key_help = (
         "API key to authenticate with the IMAP SDC. "
@@ -196,11 +215,12 @@ def main():  # noqa: PLR0915
         "and upload data files."
     )
     download_help = (
-        "Download a file from the IMAP SDC to the locally configured data directory. "
+        "Download files from the IMAP SDC to the locally configured data directory. "
         "Run 'download -h' for more information. "
     )
     help_menu_for_download = (
-        "Download a file from the IMAP SDC to the locally configured data directory. "
+        "Download files from the IMAP SDC to the locally configured data directory. "
+        "Multiple files can be given and will be downloaded concurrently. "
     )
     file_path_help = (
         "This must be the full path to the file."
@@ -263,94 +283,115 @@ def main():  # noqa: PLR0915
     parser_download = subparsers.add_parser(
         "download", help=download_help, description=help_menu_for_download
     )
-    parser_download.add_argument("file_path", type=Path, help=file_path_help)
+    if "download" in commands:
+        parser_download.add_argument(
+            "file_path", type=Path, nargs="+", help=file_path_help
+        )
+        parser_download.add_argument(
+            "-j",
+            "--concurrency",
+            "--max-conn",
+            type=int,
+            default=16,
+            dest="concurrency",
+            help="Maximum number of concurrent downloads, default is 16. "
+            "Higher values can speed up downloading many small files, but on "
+            "slow networks they can lead to timeouts.",
+        )
+        parser_download.add_argument(
+            "--no-progress",
+            action="store_true",
+            help="Do not print the paths of the downloaded files",
+        )
     parser_download.set_defaults(func=_download_parser)
 
     # Query command (with optional arguments)
     query_parser = subparsers.add_parser(
         "query", help=query_help, description=help_menu_for_query
     )
-    query_parser.add_argument(
-        "--instrument",
-        type=str,
-        required=False,
-        help="Name of the instrument",
-        choices=[
-            "codice",
-            "glows",
-            "hi",
-            "hit",
-            "idex",
-            "lo",
-            "mag",
-            "swapi",
-            "swe",
-            "ultra",
-        ],
-    )
-    query_parser.add_argument(
-        "--data-level",
-        type=str,
-        required=False,
-        help="Data level of the product (l0, l1a, l2, etc.)",
-    )
-    query_parser.add_argument(
-        "--descriptor",
-        type=str,
-        required=False,
-        help="Descriptor of the product (raw, burst, etc.)",
-    )
-    query_parser.add_argument(
-        "--start-date",
-        type=str,
-        required=False,
-        help="Start date for files in YYYYMMDD format",
-    )
-    query_parser.add_argument(
-        "--end-date",
-        type=str,
-        required=False,
-        help="End date for a range of file timestamps in YYYYMMDD format",
-    )
-    query_parser.add_argument(
-        "--repointing", type=int, required=False, help="Repointing number (int)"
-    )
-    query_parser.add_argument(
-        "--version",
-        type=str,
-        required=False,
-        help="Version of the product in the format 'v001'."
-        " Must have one other parameter to run."
-        " Passing 'latest' will return latest version of a file",
-    )
-    query_parser.add_argument(
-        "--extension", type=str, required=False, help="File extension (cdf, pkts)"
-    )
-    query_parser.add_argument(
-        "--output-format",
-        type=str,
-        required=False,
-        help="How to format the output, default is 'table'",
-        choices=["table", "json"],
-        default="table",
-    )
-    query_parser.add_argument(
-        "--filename",
-        type=str,
-        required=False,
-        help="Name of a file to be searched for. For convention standards see https://imap-"
-        "processing.readthedocs.io/en/latest/development-guide/style-guide/naming-conventions"
-        ".html#data-product-file-naming-conventions",
-    )
+    if "query" in commands:
+        query_parser.add_argument(
+            "--instrument",
+            type=str,
+            required=False,
+            help="Name of the instrument",
+            choices=sorted(imap_data_access.VALID_INSTRUMENTS),
+        )
+        query_parser.add_argument(
+            "--data-level",
+            type=str,
+            required=False,
+            help="Data level of the product (l0, l1a, l2, etc.)",
+        )
+        query_parser.add_argument(
+            "--descriptor",
+            type=str,
+            required=False,
+            help="Descriptor of the product (raw, burst, etc.)",
+        )
+        query_parser.add_argument(
+            "--start-date",
+            type=str,
+            required=False,
+            help="Start date for files in YYYYMMDD format",
+        )
+        query_parser.add_argument(
+            "--end-date",
+            type=str,
+            required=False,
+            help="End date for a range of file timestamps in YYYYMMDD format",
+        )
+        query_parser.add_argument(
+            "--repointing", type=int, required=False, help="Repointing number (int)"
+        )
+        query_parser.add_argument(
+            "--version",
+            type=str,
+            required=False,
+            help="Version of the product in the format 'v001'."
+            " Must have one other parameter to run."
+            " Passing 'latest' will return latest version of a file",
+        )
+        query_parser.add_argument(
+            "--extension", type=str, required=False, help="File extension (cdf, pkts)"
+        )
+        query_parser.add_argument(
+            "--output-format",
+            type=str,
+            required=False,
+            help="How to format the output, default is 'table'",
+            choices=["table", "json"],
+            default="table",
+        )
+        query_parser.add_argument(
+            "--filename",
+            type=str,
+            required=False,
+            help="Name of a file to be searched for. For convention standards see https://imap-"
+            "processing.readthedocs.io/en/latest/development-guide/style-guide/naming-conventions"
+            ".html#data-product-file-naming-conventions",
+        )
     query_parser.set_defaults(func=_query_parser)
 
     # Upload command
     parser_upload = subparsers.add_parser(
         "upload", help=upload_help, description=help_menu_for_upload
     )
-    parser_upload.add_argument("file_path", type=Path, help=file_path_help)
+    if "upload" in commands:
+        parser_upload.add_argument("file_path", type=Path, help=file_path_help)
     parser_upload.set_defaults(func=_upload_parser)
 
+    return parser
+
+
+def main():
+    """Parse the command line arguments.
+
+    Run the command line interface to the IMAP Data Access API.
+    """
+    # Only the subcommand that is being run needs its arguments set up
+    parser = _build_parser(frozenset(sys.argv[1:]) & _COMMANDS)
+
     # Parse the arguments and set the values
     try:
         args = parser.parse_args()
@@ -3,16 +3,130 @@
 
 from __future__ import annotations
 
+import calendar
+import functools
+import os
 import re
-from datetime import datetime
 from pathlib import Path
 
 import imap_data_access
 
+_SCIENCE_FILENAME_RE = re.compile(
+    r"^(?P<mission>imap)_"
+    r"(?P<instrument>[^_]+)_"
+    r"(?P<data_level>[^_]+)_"
+    r"(?P<descriptor>[^_]+)_"
+    r"(?P<start_date>\d{8})"
+    r"(-repoint(?P<repointing>\d{5}))?"  # Optional repointing field
+    r"_(?P<version>v\d{3})"
+    r"\.(?P<extension>cdf|pkts)$"
+)
+# The extensions accepted by the science filename patterns
+_SCIENCE_FILE_SUFFIXES = (".cdf", ".pkts")
+_VERSION_RE = re.compile(r"v\d{3}")
+_REPOINTING_RE = re.compile(r"repoint\d{5}")
+# Number of days in each month of a non-leap year
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _alternation(values: frozenset[str]) -> str:
+    """Create a regex alternation that matches any of the given values exactly."""
+    return "|".join(re.escape(value) for value in sorted(values))
+
+
+# The same pattern, but only matching valid instruments and data levels.
+# Filenames that match this only need their dates and extensions checked,
+# anything else goes through the full validation to get a useful error message.
+_STRICT_SCIENCE_FILENAME_RE = re.compile(
+    r"^(?P<mission>imap)_"
+    rf"(?P<instrument>{_alternation(imap_data_access.VALID_INSTRUMENTS)})_"
+    rf"(?P<data_level>{_alternation(imap_data_access.VALID_DATALEVELS)})_"
+    r"(?P<descriptor>[^_]+)_"
+    r"(?P<start_date>\d{8})"
+    r"(-repoint(?P<repointing>\d{5}))?"  # Optional repointing field
+    r"_(?P<version>v\d{3})"
+    r"\.(?P<extension>cdf|pkts)$"
+)
+
+
+def _basename(filename: str | Path) -> str:
+    """Get the name of a file without any directory components.
+
+    Strings are split with ``os.path.basename`` rather than creating a
+    ``Path`` from them just to take its name.
+    """
+    if isinstance(filename, Path):
+        return filename.name
+    return os.path.basename(filename)
+
+
+@functools.lru_cache(maxsize=1024)
+def _match_science_filename(filename: str, strict: bool = False) -> re.Match | None:
+    """Match a filename against the science filename pattern.
+
+    The same filenames tend to be parsed many times (querying, downloading,
+    constructing paths), so the match results are cached by filename.
+
+    Parameters
+    ----------
+    filename : str
+        Name of the file, without any directory components.
+    strict : bool
+        Whether to only match valid instruments and data levels.
+
+    Returns
+    -------
+    re.Match or None
+        The match object, or None if the filename does not match.
+    """
+    # Reject other file types, e.g. when scanning a mixed directory,
+    # without running the pattern over the whole name
+    if not filename.endswith(_SCIENCE_FILE_SUFFIXES):
+        return None
+    # fullmatch, as "$" in the patterns would also match before a trailing newline
+    if strict:
+        return _STRICT_SCIENCE_FILENAME_RE.fullmatch(filename)
+    return _SCIENCE_FILENAME_RE.fullmatch(filename)
+
+
+def _science_filename_components(match: re.Match) -> dict:
+    """Get the filename components from a science filename match.
+
+    Parameters
+    ----------
+    match : re.Match
+        Match of one of the science filename patterns.
+
+    Returns
+    -------
+    components : dict
+        Dictionary containing components.
+    """
+    components = match.groupdict()
+    if components["repointing"]:
+        # We want the repointing number as an integer
+        components["repointing"] = int(components["repointing"])
+    return components
+
 
 class ScienceFilePath:
     """Class for building and validating filepaths for science files."""
 
+    # Many instances can be created when working with query results,
+    # so only store the fixed set of attributes without a __dict__
+    __slots__ = (
+        "data_dir",
+        "data_level",
+        "descriptor",
+        "extension",
+        "filename",
+        "instrument",
+        "mission",
+        "repointing",
+        "start_date",
+        "version",
+    )
+
     class InvalidScienceFileError(Exception):
         """Indicates a bad file type."""
 
@@ -45,16 +159,23 @@ class ScienceFilePath:
         filename : str | Path
             Science data filename or file path.
         """
-        self.filename = Path(filename)
+        # Only the name of the file is needed, the directories are
+        # determined from the filename components
+        name = _basename(filename)
         self.data_dir = imap_data_access.config["DATA_DIR"]
 
-        try:
-            split_filename = self.extract_filename_components(self.filename)
-        except ValueError as err:
-            raise self.InvalidScienceFileError(
-                f"Invalid filename. Expected file to match format: "
-                f"{imap_data_access.FILENAME_CONVENTION}"
-            ) from err
+        # Valid filenames are the common case, so try the strict pattern first
+        strict_match = _match_science_filename(name, strict=True)
+        if strict_match is not None:
+            split_filename = _science_filename_components(strict_match)
+        else:
+            try:
+                split_filename = self.extract_filename_components(name)
+            except ValueError as err:
+                raise self.InvalidScienceFileError(
+                    f"Invalid filename. Expected file to match format: "
+                    f"{imap_data_access.FILENAME_CONVENTION}"
+                ) from err
 
         self.mission = split_filename["mission"]
         self.instrument = split_filename["instrument"]
@@ -64,10 +185,49 @@ class ScienceFilePath:
         self.repointing = split_filename["repointing"]
         self.version = split_filename["version"]
         self.extension = split_filename["extension"]
+        self.filename = Path(name)
+
+        # The strict pattern has already checked everything
+        # except for the date and the extension for the data level
+        if not (
+            strict_match is not None
+            and (self.extension == "pkts") == (self.data_level == "l0")
+            and self.is_valid_date(self.start_date)
+        ):
+            error_message = self.validate_filename()
+            if error_message:
+                raise self.InvalidScienceFileError(f"{error_message}")
+
+    @property
+    def error_message(self) -> str:
+        """Error message from validating the filename.
 
-        self.error_message = self.validate_filename()
-        if self.error_message:
-            raise self.InvalidScienceFileError(f"{self.error_message}")
+        An instance can only be created for a valid filename,
+        so this is always an empty string.
+        """
+        return ""
+
+    @classmethod
+    def from_name(cls, filename: str) -> ScienceFilePath:
+        """Get a ScienceFilePath instance for a filename, reusing earlier instances.
+
+        Parsing and validating the same filename repeatedly is avoided by caching
+        the instances for each filename and data directory. The returned instance
+        may be shared with other callers, so it should not be modified.
+
+        Parameters
+        ----------
+        filename : str
+            Science data filename.
+
+        Returns
+        -------
+        ScienceFilePath
+            The instance for the filename
+        """
+        return _cached_science_file_path(
+            cls, filename, imap_data_access.config["DATA_DIR"]
+        )
 
     @classmethod
     def generate_from_inputs(
@@ -135,17 +295,15 @@ class ScienceFilePath:
         """
         error_message = ""
 
-        if any(
-            attr is None or attr == ""
-            for attr in [
-                self.mission,
-                self.instrument,
-                self.data_level,
-                self.descriptor,
-                self.start_date,
-                self.version,
-                self.extension,
-            ]
+        # None and "" are both falsy, so a missing attribute ends the chain
+        if not (
+            self.mission
+            and self.instrument
+            and self.data_level
+            and self.descriptor
+            and self.start_date
+            and self.version
+            and self.extension
         ):
             error_message = (
                 f"Invalid filename, missing attribute. Filename "
@@ -158,17 +316,17 @@ class ScienceFilePath:
             error_message += (
                 f"Invalid instrument {self.instrument}. Please choose "
                 f"from "
-                f"{imap_data_access.VALID_INSTRUMENTS} \n"
+                f"{', '.join(sorted(imap_data_access.VALID_INSTRUMENTS))} \n"
             )
         if self.data_level not in imap_data_access.VALID_DATALEVELS:
             error_message += (
                 f"Invalid data level {self.data_level}. Please choose "
                 f"from "
-                f"{imap_data_access.VALID_DATALEVELS} \n"
+                f"{', '.join(sorted(imap_data_access.VALID_DATALEVELS))} \n"
             )
         if not self.is_valid_date(self.start_date):
             error_message += "Invalid start date format. Please use YYYYMMDD format. \n"
-        if not bool(re.match(r"^v\d{3}$", self.version)):
+        if not _VERSION_RE.fullmatch(self.version):
             error_message += "Invalid version format. Please use vXXX format. \n"
         if self.repointing and not isinstance(self.repointing, int):
             error_message += "The repointing number should be an integer.\n"
@@ -198,14 +356,20 @@ class ScienceFilePath:
         bool
             Whether date input is valid or not
         """
+        # This checks if date is in YYYYMMDD format.
+        # Sometimes, date is correct but not in the format we want
+        if len(input_date) != 8 or not (input_date.isascii() and input_date.isdigit()):
+            return False
+
         # Validate if it's a real date
-        try:
-            # This checks if date is in YYYYMMDD format.
-            # Sometimes, date is correct but not in the format we want
-            datetime.strptime(input_date, "%Y%m%d")
-            return True
-        except ValueError:
+        year = int(input_date[:4])
+        month = int(input_date[4:6])
+        day = int(input_date[6:])
+        if year < 1 or not 1 <= month <= 12 or day < 1:
             return False
+        if month == 2 and calendar.isleap(year):
+            return day <= 29
+        return day <= _DAYS_IN_MONTH[month - 1]
 
     @staticmethod
     def is_valid_version(input_version: str) -> bool:
@@ -221,7 +385,7 @@ class ScienceFilePath:
         bool
             Whether input version is valid or not.
         """
-        return input_version == "latest" or re.fullmatch(r"v\d{3}", input_version)
+        return input_version == "latest" or _VERSION_RE.fullmatch(input_version)
 
     @staticmethod
     def is_valid_repointing(input_repointing: str) -> bool:
@@ -237,7 +401,7 @@ class ScienceFilePath:
         bool
             Whether input repointing is valid or not.
         """
-        return re.fullmatch(r"repoint\d{5}", str(input_repointing))
+        return _REPOINTING_RE.fullmatch(str(input_repointing))
 
     def construct_path(self) -> Path:
         """Construct valid path from class variables and data_dir.
@@ -252,14 +416,31 @@ class ScienceFilePath:
         Path
             Upload path
         """
-        upload_path = Path(
+        # Build the path as a string and only create a single Path from it
+        upload_path = self.relative_path
+        if self.data_dir:
+            return Path(self.data_dir, upload_path)
+
+        return Path(upload_path)
+
+    @property
+    def relative_path(self) -> str:
+        """Path of the file relative to the data directory.
+
+        This is also the path of the file in the data archive.
+
+        expected return:
+        mission/instrument/data_level/startdate_month/startdate_day/filename
+
+        Returns
+        -------
+        str
+            Relative path, with "/" separators
+        """
+        return (
             f"{self.mission}/{self.instrument}/{self.data_level}/"
             f"{self.start_date[:4]}/{self.start_date[4:6]}/{self.filename}"
         )
-        if self.data_dir:
-            upload_path = self.data_dir / upload_path
-
-        return upload_path
 
     @staticmethod
     def extract_filename_components(filename: str | Path) -> dict:
@@ -283,31 +464,28 @@ class ScienceFilePath:
         components : dict
             Dictionary containing components.
         """
-        pattern = (
-            r"^(?P<mission>imap)_"
-            r"(?P<instrument>[^_]+)_"
-            r"(?P<data_level>[^_]+)_"
-            r"(?P<descriptor>[^_]+)_"
-            r"(?P<start_date>\d{8})"
-            r"(-repoint(?P<repointing>\d{5}))?"  # Optional repointing field
-            r"_(?P<version>v\d{3})"
-            r"\.(?P<extension>cdf|pkts)$"
-        )
-        if isinstance(filename, Path):
-            filename = filename.name
+        filename = _basename(filename)
 
-        match = re.match(pattern, filename)
+        match = _match_science_filename(filename)
         if match is None:
             raise ScienceFilePath.InvalidScienceFileError(
                 f"Filename {filename} does not match expected pattern: "
                 f"{imap_data_access.FILENAME_CONVENTION}"
             )
 
-        components = match.groupdict()
-        if components["repointing"]:
-            # We want the repointing number as an integer
-            components["repointing"] = int(components["repointing"])
-        return components
+        return _science_filename_components(match)
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_science_file_path(
+    cls: type[ScienceFilePath], filename: str, data_dir: Path
+) -> ScienceFilePath:
+    """Create a ScienceFilePath, cached by the filename and data directory.
+
+    The data directory is only part of the cache key, so that changing
+    the configured data directory creates new instances.
+    """
+    return cls(filename)
 
 
 # Transform the suffix to the directory structure we are using
@@ -341,10 +519,18 @@ https://naif.jpl.nasa.gov/pub/naif/toolkit_docs/C/req/kernel.html
 .tsc   text SCLK
 """
 
+_SPICE_SUFFIXES = frozenset(_SPICE_DIR_MAPPING)
+_INVALID_SPICE_FILE_MESSAGE = (
+    f"Invalid SPICE file. Expected file to have one of the following "
+    f"extensions {list(_SPICE_DIR_MAPPING)}"
+)
+
 
 class SPICEFilePath:
     """Class for building and validating filepaths for SPICE files."""
 
+    __slots__ = ("filename",)
+
     class InvalidSPICEFileError(Exception):
         """Indicates a bad file type."""
 
@@ -364,13 +550,15 @@ class SPICEFilePath:
         filename : str | Path
             SPICE data filename or file path.
         """
-        self.filename = Path(filename)
+        if isinstance(filename, Path):
+            suffix = filename.suffix
+        else:
+            suffix = os.path.splitext(filename)[1]
 
-        if self.filename.suffix not in _SPICE_DIR_MAPPING:
-            raise self.InvalidSPICEFileError(
-                f"Invalid SPICE file. Expected file to have one of the following "
-                f"extensions {list(_SPICE_DIR_MAPPING.keys())}"
-            )
+        if suffix not in _SPICE_SUFFIXES:
+            raise self.InvalidSPICEFileError(_INVALID_SPICE_FILE_MESSAGE)
+
+        self.filename = Path(filename)
 
     def construct_path(self) -> Path:
         """Construct valid path from the class variables and data_dir.
@@ -383,8 +571,23 @@ class SPICEFilePath:
         Path
             Upload path
         """
-        spice_dir = imap_data_access.config["DATA_DIR"] / "spice"
-        subdir = _SPICE_DIR_MAPPING[self.filename.suffix]
-        # Use the file suffix to determine the directory structure
         # IMAP_DATA_DIR/spice/<subdir>/filename
-        return spice_dir / subdir / self.filename
+        return Path(imap_data_access.config["DATA_DIR"], self.relative_path)
+
+    @property
+    def relative_path(self) -> str:
+        """Path of the file relative to the data directory.
+
+        This is also the path of the file in the data archive.
+
+        expected return:
+        spice/<subdir>/filename
+
+        Returns
+        -------
+        str
+            Relative path, with "/" separators
+        """
+        # Use the file suffix to determine the directory structure
+        subdir = _SPICE_DIR_MAPPING[self.filename.suffix]
+        return f"spice/{subdir}/{self.filename.name}"
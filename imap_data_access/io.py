@@ -1,22 +1,46 @@
 """Input/output capabilities for the IMAP data processing pipeline."""
 
-# ruff: noqa: PLR0913 S310
+# ruff: noqa: PLR0913 S310 S311
 # too many arguments, but we want all of these explicitly listed
 # potentially unsafe usage of urlopen, but we aren't concerned here
+# pseudo-random numbers are only used to jitter the delays between retries
 import contextlib
+import functools
+import hashlib
 import json
 import logging
+import os
+import random
+import shutil
+import socket
+import tempfile
+import time
 import urllib.request
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Union
+from typing import BinaryIO, Optional, Union
 from urllib.error import HTTPError, URLError
-from urllib.parse import urlencode
+from urllib.parse import urlencode, urlparse
 
 import imap_data_access
 from imap_data_access import file_validation
 
 logger = logging.getLogger(__name__)
 
+# Size of the chunks to read from the response when downloading files
+_DOWNLOAD_CHUNK_SIZE = 128 * 1024
+# Size of the write buffer for downloaded files, several chunks are
+# collected before they are written to disk
+_DOWNLOAD_BUFFER_SIZE = 1024 * 1024
+# Idempotent requests are retried this many times on transient errors, waiting
+# roughly _RETRY_BACKOFF * 2**attempt seconds (at most _RETRY_MAX_DELAY) between
+_RETRY_ATTEMPTS = 4
+_RETRY_BACKOFF = 0.5
+_RETRY_MAX_DELAY = 5
+_RETRY_METHODS = frozenset({"GET", "HEAD"})
+_RETRY_STATUS_CODES = frozenset({502, 503, 504})
+
 
 class IMAPDataAccessError(Exception):
     """Base class for exceptions in this module."""
@@ -24,6 +48,48 @@ class IMAPDataAccessError(Exception):
     pass
 
 
+class _NotModifiedError(IMAPDataAccessError):
+    """The server responded to a conditional request with 304 Not Modified."""
+
+
+def _is_transient_error(error: OSError) -> bool:
+    """Whether a request that failed with this error is worth retrying."""
+    if isinstance(error, HTTPError):
+        return error.code in _RETRY_STATUS_CODES
+    if isinstance(error, URLError):
+        error = error.reason
+    return isinstance(error, (ConnectionError, TimeoutError, socket.timeout))
+
+
+def _urlopen(request: urllib.request.Request):
+    """Open a URL request, retrying idempotent requests on transient errors.
+
+    GET and HEAD requests that fail with a 502, 503 or 504 status, or with
+    a dropped or timed out connection, are retried with a jittered
+    exponential backoff. Any other error is raised immediately.
+    """
+    retries = _RETRY_ATTEMPTS if request.get_method() in _RETRY_METHODS else 0
+    attempt = 0
+    while True:
+        try:
+            return urllib.request.urlopen(request)
+        except OSError as e:
+            if attempt == retries or not _is_transient_error(e):
+                raise
+            if isinstance(e, HTTPError):
+                # Release the connection of the failed response before retrying
+                e.close()
+            delay = min(_RETRY_BACKOFF * 2**attempt + random.random(), _RETRY_MAX_DELAY)
+            logger.info(
+                "Request to %s failed (%s), retrying in %.1f seconds",
+                request.full_url,
+                e,
+                delay,
+            )
+            time.sleep(delay)
+            attempt += 1
+
+
 @contextlib.contextmanager
 def _get_url_response(request: urllib.request.Request):
     """Get the response from a URL request.
@@ -34,15 +100,21 @@ def _get_url_response(request: urllib.request.Request):
     """
     try:
         # Open the URL and yield the response
-        with urllib.request.urlopen(request) as response:
+        with _urlopen(request) as response:
             yield response
 
     except HTTPError as e:
         if e.status == 307:
             # If the server is redirecting us, we need to follow the redirect
             request.full_url = e.headers["Location"]
+            if hasattr(request.data, "seek"):
+                # A streamed upload body was consumed by the first request,
+                # so send it again from the start
+                request.data.seek(0)
             with _get_url_response(request) as response:
                 yield response
+        elif e.status == 304:
+            raise _NotModifiedError("Not Modified") from e
         else:
             message = (
                 f"HTTP Error: {e.code} - {e.reason}\n"
@@ -55,60 +127,467 @@ def _get_url_response(request: urllib.request.Request):
         raise IMAPDataAccessError(message) from e
 
 
-def download(file_path: Union[Path, str]) -> Path:
+def _query_cache_ttl() -> float:
+    """Get the number of seconds that query responses are cached for.
+
+    Returns
+    -------
+    float
+        Number of seconds query responses are valid for, 0 if caching is disabled
+
+    Raises
+    ------
+    ValueError
+        If ``QUERY_CACHE_TTL`` is not a number
+    """
+    ttl = imap_data_access.config["QUERY_CACHE_TTL"]
+    if not ttl:
+        return 0
+    try:
+        return float(ttl)
+    except ValueError:
+        raise ValueError(
+            f"Not a valid QUERY_CACHE_TTL {ttl!r}, use a number of seconds."
+        ) from None
+
+
+def _query_cache_file(url: str) -> Optional[Path]:
+    """Get the cache file for a query URL.
+
+    Parameters
+    ----------
+    url : str
+        Full URL of the query, including the query parameters
+
+    Returns
+    -------
+    pathlib.Path or None
+        Path to the file the query response is cached in, or None if there is
+        no cache directory to use
+    """
+    cache_dir = imap_data_access.config["QUERY_CACHE_DIR"]
+    if cache_dir is None:
+        try:
+            cache_home = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+        except RuntimeError as e:
+            # There is no home directory, e.g. for some container users
+            logger.debug("Unable to find a directory to cache queries in: %s", e)
+            return None
+        cache_dir = Path(cache_home, "imap_data_access", "queries")
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return Path(cache_dir, f"{key}.json")
+
+
+@functools.lru_cache(maxsize=256)
+def _load_query_cache(cache_file: Path, mtime: float) -> list[dict]:
+    """Decode a cached query response.
+
+    The decoded responses are kept in memory keyed by the modification time of
+    the file, so repeated queries in the same process skip reading and decoding
+    the file until it is rewritten.
+
+    Parameters
+    ----------
+    cache_file : pathlib.Path
+        Path to the cached query response
+    mtime : float
+        Modification time of the cached query response
+
+    Returns
+    -------
+    list
+        List of files in the cached query response
+    """
+    return json.loads(cache_file.read_bytes())
+
+
+def _read_query_cache(cache_file: Path, ttl: float) -> Optional[list[dict]]:
+    """Read a cached query response if it is newer than ``ttl`` seconds.
+
+    Parameters
+    ----------
+    cache_file : pathlib.Path
+        Path to the cached query response
+    ttl : float
+        Number of seconds the cached response is valid for
+
+    Returns
+    -------
+    list or None
+        List of files in the cached response, or None if there is no valid
+        cached response
+    """
+    try:
+        mtime = cache_file.stat().st_mtime
+        if time.time() - mtime > ttl:
+            return None
+        items = _load_query_cache(cache_file, mtime)
+    except (OSError, ValueError):
+        return None
+    # Copy the items so that callers can't modify the cached response
+    return [dict(item) for item in items]
+
+
+def _write_query_cache(cache_file: Path, content: bytes) -> None:
+    """Write a query response to the cache.
+
+    The response is written to a temporary file first and then moved into
+    place, so concurrent readers never see a partially written file.
+
+    Parameters
+    ----------
+    cache_file : pathlib.Path
+        Path to cache the query response in
+    content : bytes
+        Query response to cache
+    """
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=cache_file.parent, suffix=".tmp", delete=False
+        ) as tmp_file:
+            tmp_file.write(content)
+        os.replace(tmp_file.name, cache_file)
+    except OSError as e:
+        # The cache is only an optimization, so don't fail the query over it
+        logger.debug("Unable to cache the query response in %s: %s", cache_file, e)
+
+
+def _etag_file(destination: Path) -> Path:
+    """Get the sidecar file that stores the ETag of a downloaded file."""
+    return destination.with_name(f"{destination.name}.etag")
+
+
+def _is_up_to_date(url: str, destination: Path) -> bool:
+    """Check whether a local file matches the file in the data archive.
+
+    A HEAD request is made for the file and its size is compared against the
+    local file. This is used for files without a stored ETag, files with one
+    are checked with a conditional GET instead. If the size can't be found,
+    e.g. because the archive redirects to a URL that only allows GET requests,
+    the file is treated as out of date so it is downloaded again.
+
+    Parameters
+    ----------
+    url : str
+        URL of the file in the data archive
+    destination : pathlib.Path
+        Path to the local file
+
+    Returns
+    -------
+    bool
+        Whether the local file matches the file in the data archive
+    """
+    request = urllib.request.Request(url, method="HEAD")
+    try:
+        with _get_url_response(request) as response:
+            size = response.headers.get("Content-Length")
+    except IMAPDataAccessError as e:
+        logger.debug("Unable to check the size of %s: %s", url, e)
+        return False
+
+    return size is not None and int(size) == destination.stat().st_size
+
+
+def _partial_file(destination: Path) -> Path:
+    """Get the file that a download is written to until it is complete."""
+    return destination.with_name(f"{destination.name}.part")
+
+
+def _open_download_file(destination: Path) -> BinaryIO:
+    """Open the partial file for a download for writing.
+
+    Files are usually downloaded into directories that already exist, so the
+    directories are only created if opening the file fails, rather than
+    checking for them before every download.
+
+    Parameters
+    ----------
+    destination : pathlib.Path
+        Path to the file being downloaded
+
+    Returns
+    -------
+    BinaryIO
+        The open partial file
+    """
+    partial_file = _partial_file(destination)
+    try:
+        return open(partial_file, "wb", buffering=_DOWNLOAD_BUFFER_SIZE)
+    except FileNotFoundError:
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        return open(partial_file, "wb", buffering=_DOWNLOAD_BUFFER_SIZE)
+
+
+def _save_response(response, destination: Path, *, store_etag: bool) -> None:
+    """Save the body of a download response to the destination file.
+
+    The response is written to a partial file which is only moved to the
+    destination once it is complete, so a failed download never replaces or
+    leaves behind an incomplete file.
+
+    Parameters
+    ----------
+    response : http.client.HTTPResponse
+        Response to the download request
+    destination : pathlib.Path
+        Path to save the file to
+    store_etag : bool
+        Whether to store the ETag of the response alongside the file
+    """
+    partial_file = _partial_file(destination)
+    try:
+        # Stream the response to disk in chunks rather than reading
+        # the whole file into memory first
+        with _open_download_file(destination) as local_file:
+            shutil.copyfileobj(response, local_file, length=_DOWNLOAD_CHUNK_SIZE)
+        os.replace(partial_file, destination)
+    except BaseException:
+        partial_file.unlink(missing_ok=True)
+        raise
+
+    # Store the ETag so the file can be checked against the archive later,
+    # a stored ETag from a previous download no longer applies
+    etag = response.headers.get("ETag") if store_etag else None
+    etag_file = _etag_file(destination)
+    if etag is not None:
+        etag_file.write_text(etag)
+    else:
+        etag_file.unlink(missing_ok=True)
+
+
+def _copy_local_file(url: str, destination: Path) -> None:
+    """Copy a file from a local mirror of the data archive.
+
+    ``shutil.copyfile`` lets the operating system copy the data directly
+    between the files where it is supported (e.g. ``sendfile`` on Linux),
+    instead of passing it through Python like a response from ``urlopen``.
+
+    Parameters
+    ----------
+    url : str
+        ``file:`` URL of the file to copy
+    destination : pathlib.Path
+        Path to copy the file to
+    """
+    source = Path(urllib.request.url2pathname(urlparse(url).path))
+    partial_file = _partial_file(destination)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        # Copy to a partial file first, see _save_response()
+        shutil.copyfile(source, partial_file)
+        os.replace(partial_file, destination)
+    except OSError as e:
+        partial_file.unlink(missing_ok=True)
+        raise IMAPDataAccessError(f"URL Error: {e}") from e
+    # Local files have no ETag, so make sure a stale one isn't kept
+    _etag_file(destination).unlink(missing_ok=True)
+
+
+def _run_concurrently(
+    function: Callable,
+    file_paths: Iterable[Union[Path, str]],
+    max_workers: int,
+    action: str,
+) -> list:
+    """Call a function for each file from a pool of threads.
+
+    Downloads and uploads are I/O bound, so running them from a pool of threads
+    overlaps the requests rather than waiting for each file in turn. A failure
+    for one file doesn't stop the others, all of the failures are reported
+    together once every file has been processed.
+
+    Parameters
+    ----------
+    function : callable
+        Function to call with each file path
+    file_paths : iterable of pathlib.Path or str
+        Paths of the files to process
+    max_workers : int
+        Maximum number of files to process at the same time
+    action : str
+        Name of the action for the error message, e.g. ``download``
+
+    Returns
+    -------
+    list
+        Return values of the function, in the same order as ``file_paths``
+
+    Raises
+    ------
+    IMAPDataAccessError
+        If the function raised an exception for any of the files
+    """
+    file_paths = list(file_paths)
+    if not file_paths:
+        return []
+
+    def _call(file_path: Union[Path, str]):
+        try:
+            return function(file_path), None
+        except Exception as e:
+            return None, f"{file_path}: {e}"
+
+    max_workers = max(1, min(max_workers, len(file_paths)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(_call, file_paths))
+
+    errors = [error for _, error in results if error]
+    if errors:
+        raise IMAPDataAccessError(
+            f"Failed to {action} {len(errors)} of {len(results)} files\n"
+            + "\n".join(errors)
+        )
+    return [result for result, _ in results]
+
+
+def download(file_path: Union[Path, str], *, verify: bool = False) -> Path:
     """Download a file from the data archive.
 
     Parameters
     ----------
     file_path : pathlib.Path or str
         Name of the file to download, optionally including the directory path
+    verify : bool, optional
+        If the file already exists locally, check that it matches the file in
+        the data archive and download it again if not. The ETag of the file is
+        stored alongside it in a ``.etag`` file to make the check cheaper next
+        time. By default existing files are never downloaded again.
 
     Returns
     -------
     pathlib.Path
         Path to the downloaded file
     """
-    destination = imap_data_access.config["DATA_DIR"]
-    # Create the proper file path object based on the extension and filename
-    file_path = Path(file_path)
-    if file_path.suffix in imap_data_access.file_validation._SPICE_DIR_MAPPING:
+    # Create the proper file path object based on the extension and filename,
+    # only the name is needed so string inputs aren't turned into a Path first
+    name = file_validation._basename(file_path)
+    if os.path.splitext(name)[1] in file_validation._SPICE_SUFFIXES:
         # SPICE
-        path_obj = imap_data_access.SPICEFilePath(file_path.name)
+        path_obj = imap_data_access.SPICEFilePath(name)
     else:
         # Science
-        path_obj = imap_data_access.ScienceFilePath(file_path.name)
+        path_obj = imap_data_access.ScienceFilePath.from_name(name)
 
     destination = path_obj.construct_path()
 
     # Update the file_path with the full path for the download below
-    file_path = destination.relative_to(imap_data_access.config["DATA_DIR"]).as_posix()
+    file_path = path_obj.relative_path
 
-    # Only download if the file doesn't already exist
-    # TODO: Do we want to verify any hashes to make sure we have the right file?
+    url = f"{imap_data_access.config['DATA_ACCESS_URL']}/download/{file_path}"
+
+    # Only download if the file doesn't already exist, or doesn't match the
+    # archive when verifying
+    headers = {}
     if destination.exists():
-        logger.info("The file %s already exists, skipping download", destination)
-        return destination
+        if not verify:
+            logger.info("The file %s already exists, skipping download", destination)
+            return destination
+        etag_file = _etag_file(destination)
+        if etag_file.exists():
+            # Let the server skip sending the file if it hasn't changed
+            headers["If-None-Match"] = etag_file.read_text()
+        elif _is_up_to_date(url, destination):
+            logger.info("The file %s is up to date, skipping download", destination)
+            return destination
+        else:
+            logger.info("The file %s does not match the archive", destination)
 
-    # encode the query parameters
-    url = f"{imap_data_access.config['DATA_ACCESS_URL']}"
-    url += f"/download/{file_path}"
     logger.info("Downloading file %s from %s to %s", file_path, url, destination)
 
+    if url.startswith("file:"):
+        # The archive is a local mirror, so copy the file directly
+        _copy_local_file(url, destination)
+        return destination
+
     # Create a request with the provided URL
-    request = urllib.request.Request(url, method="GET")
+    request = urllib.request.Request(url, method="GET", headers=headers)
     # Open the URL and download the file
-    with _get_url_response(request) as response:
-        logger.debug("Received response: %s", response)
-        # Save the file locally with the same filename
-        destination.parent.mkdir(parents=True, exist_ok=True)
-        with open(destination, "wb") as local_file:
-            local_file.write(response.read())
+    try:
+        with _get_url_response(request) as response:
+            _save_response(response, destination, store_etag=verify)
+    except _NotModifiedError:
+        logger.info("The file %s is up to date, skipping download", destination)
 
     return destination
 
 
-# Too many branches error
-# ruff: noqa: PLR0912
+def download_many(
+    file_paths: Iterable[Union[Path, str]],
+    *,
+    max_workers: int = 16,
+    verify: bool = False,
+) -> list[Path]:
+    """Download multiple files from the data archive concurrently.
+
+    Downloading is I/O bound, so the files are downloaded from a pool of threads
+    to overlap the requests rather than waiting for each file in turn.
+
+    Parameters
+    ----------
+    file_paths : iterable of pathlib.Path or str
+        Names of the files to download, optionally including the directory paths
+    max_workers : int, optional
+        Maximum number of files to download at the same time
+    verify : bool, optional
+        Check that files which already exist locally match the files in the
+        data archive, see :func:`download`
+
+    Returns
+    -------
+    list of pathlib.Path
+        Paths to the downloaded files, in the same order as ``file_paths``
+
+    Raises
+    ------
+    IMAPDataAccessError
+        If any of the downloads failed. The other files are still downloaded.
+    """
+    return _run_concurrently(
+        functools.partial(download, verify=verify), file_paths, max_workers, "download"
+    )
+
+
+# Validation function and error message for each query parameter that is checked,
+# the messages are built once here rather than every time a check fails. The
+# parameters are checked in this order, so it decides which error is reported
+# when several parameters are invalid.
+_QUERY_VALIDATORS = {
+    "instrument": (
+        imap_data_access.VALID_INSTRUMENTS.__contains__,
+        "Not a valid instrument, please choose from "
+        + ", ".join(sorted(imap_data_access.VALID_INSTRUMENTS)),
+    ),
+    "data_level": (
+        imap_data_access.VALID_DATALEVELS.__contains__,
+        "Not a valid data level, choose from "
+        + ", ".join(sorted(imap_data_access.VALID_DATALEVELS)),
+    ),
+    "start_date": (
+        file_validation.ScienceFilePath.is_valid_date,
+        "Not a valid start date, use format 'YYYYMMDD'.",
+    ),
+    "end_date": (
+        file_validation.ScienceFilePath.is_valid_date,
+        "Not a valid end date, use format 'YYYYMMDD'.",
+    ),
+    "version": (
+        file_validation.ScienceFilePath.is_valid_version,
+        "Not a valid version, use format 'vXXX'.",
+    ),
+    "repointing": (
+        file_validation.ScienceFilePath.is_valid_repointing,
+        "Not a valid repointing, use format repoint<num>,"
+        " where <num> is a 5 digit integer.",
+    ),
+    "extension": (
+        imap_data_access.VALID_FILE_EXTENSION.__contains__,
+        "Not a valid extension, choose from ('pkts', 'cdf').",
+    ),
+}
+
+
 def query(
     *,
     instrument: Optional[str] = None,
@@ -119,6 +598,7 @@ def query(
     repointing: Optional[int] = None,
     version: Optional[str] = None,
     extension: Optional[str] = None,
+    use_cache: bool = True,
 ) -> list[dict[str, str]]:
     """Query the data archive for files matching the parameters.
 
@@ -147,6 +627,10 @@ def query(
         Data version in the format ``vXXX`` or 'latest'.
     extension : str, optional
         File extension (``cdf``, ``pkts``)
+    use_cache : bool, optional
+        Whether to use the on-disk query cache, if it is enabled through
+        ``imap_data_access.config["QUERY_CACHE_TTL"]``. Set this to False to
+        always request fresh results from the data archive.
 
     Returns
     -------
@@ -155,7 +639,11 @@ def query(
     """
     # locals() gives us the keyword arguments passed to the function
     # and allows us to filter out the None values
-    query_params = {key: value for key, value in locals().items() if value is not None}
+    query_params = {
+        key: value
+        for key, value in locals().items()
+        if value is not None and key != "use_cache"
+    }
 
     # removing version from query if it is 'latest',
     # ensuring other parameters are passed
@@ -169,74 +657,45 @@ def query(
             "At least one query parameter must be provided. "
             "Run 'query -h' for more information."
         )
-    # Check instrument name
-    if instrument is not None and instrument not in imap_data_access.VALID_INSTRUMENTS:
-        raise ValueError(
-            "Not a valid instrument, please choose from "
-            + ", ".join(imap_data_access.VALID_INSTRUMENTS)
-        )
-
-    # Check data-level
-    # do an if statement that checks that data_level was passed in,
-    # then check it against all options, l0, l1a, l1b, l2, l3 etc.
-    if data_level is not None and data_level not in imap_data_access.VALID_DATALEVELS:
-        raise ValueError(
-            "Not a valid data level, choose from "
-            + ", ".join(imap_data_access.VALID_DATALEVELS)
-        )
 
-    # Check start-date
-    if start_date is not None and not file_validation.ScienceFilePath.is_valid_date(
-        start_date
-    ):
-        raise ValueError("Not a valid start date, use format 'YYYYMMDD'.")
-
-    # Check end-date
-    if end_date is not None and not file_validation.ScienceFilePath.is_valid_date(
-        end_date
-    ):
-        raise ValueError("Not a valid end date, use format 'YYYYMMDD'.")
-
-    # Check version make sure to include 'latest'
-    if version is not None and not file_validation.ScienceFilePath.is_valid_version(
-        version
-    ):
-        raise ValueError("Not a valid version, use format 'vXXX'.")
-
-    # check repointing follows 'repoint00000' format
-    if (
-        repointing is not None
-        and not file_validation.ScienceFilePath.is_valid_repointing(repointing)
-    ):
-        raise ValueError(
-            "Not a valid repointing, use format repoint<num>,"
-            " where <num> is a 5 digit integer."
-        )
+    # Check each of the given parameters
+    for key, (is_valid, message) in _QUERY_VALIDATORS.items():
+        if key in query_params and not is_valid(query_params[key]):
+            raise ValueError(message)
 
-    # check extension
-    if extension is not None and extension not in imap_data_access.VALID_FILE_EXTENSION:
-        raise ValueError("Not a valid extension, choose from ('pkts', 'cdf').")
+    base_url = imap_data_access.config["DATA_ACCESS_URL"]
+    url = f"{base_url}/query?{urlencode(query_params)}"
 
-    url = f"{imap_data_access.config['DATA_ACCESS_URL']}"
-    url += f"/query?{urlencode(query_params)}"
+    ttl = _query_cache_ttl() if use_cache else 0
+    cache_file = _query_cache_file(url) if ttl > 0 else None
+    items = _read_query_cache(cache_file, ttl) if cache_file else None
 
-    logger.info("Querying data archive for %s with url %s", query_params, url)
-    request = urllib.request.Request(url, method="GET")
-    with _get_url_response(request) as response:
-        # Retrieve the response as a list of files
-        items = response.read().decode("utf-8")
-        logger.debug("Received response: %s", items)
-        # Decode the JSON string into a list
-        items = json.loads(items)
+    if items is not None:
+        logger.info("Using cached query results for %s from %s", url, cache_file)
+    else:
+        logger.info("Querying data archive for %s with url %s", query_params, url)
+        request = urllib.request.Request(url, method="GET")
+        with _get_url_response(request) as response:
+            # Retrieve the response as a list of files
+            content = response.read()
+        logger.debug("Received response: %s", content)
+        if cache_file:
+            _write_query_cache(cache_file, content)
+        # Decode the JSON into a list, json.loads detects the UTF-8 encoding
+        # of the raw bytes itself so there is no need to decode them first.
+        # Queries that match nothing are common, so skip the decoder for them.
+        items = [] if content == b"[]" else json.loads(content)
         logger.debug("Decoded JSON: %s", items)
 
     # if latest version was included in search then filter returned query for largest.
     if (version == "latest") and items:
-        max_version = max(int(each_dict.get("version")[1:4]) for each_dict in items)
+        # Parse each version number once and reuse it for the filtering
+        versions = [int(each_dict["version"][1:4]) for each_dict in items]
+        max_version = max(versions)
         items = [
             each_dict
-            for each_dict in items
-            if int(each_dict["version"][1:4]) == max_version
+            for each_dict, each_version in zip(items, versions)
+            if each_version == max_version
         ]
     return items
 
@@ -252,13 +711,14 @@ def upload(file_path: Union[Path, str], *, api_key: Optional[str] = None) -> Non
         API key to authenticate with the data access API. If not provided,
         the value from the IMAP_API_KEY environment variable will be used.
     """
-    file_path = Path(file_path).resolve()
+    # absolute() only prepends the working directory to relative paths, unlike
+    # resolve() it doesn't make syscalls for every component of the path
+    file_path = Path(file_path).absolute()
     if not file_path.exists():
         raise FileNotFoundError(file_path)
 
-    url = f"{imap_data_access.config['DATA_ACCESS_URL']}"
     # The upload name needs to be given as a path parameter
-    url += f"/upload/{file_path.name}"
+    url = f"{imap_data_access.config['DATA_ACCESS_URL']}/upload/{file_path.name}"
     logger.info("Uploading file %s to %s", file_path, url)
 
     # Create a request header with the API key
@@ -271,14 +731,55 @@ def upload(file_path: Union[Path, str], *, api_key: Optional[str] = None) -> Non
 
     with _get_url_response(request) as response:
         # Retrieve the key for the upload
-        s3_url = response.read().decode("utf-8")
+        s3_url = json.load(response)
         logger.debug("Received s3 presigned URL: %s", s3_url)
-        s3_url = json.loads(s3_url)
 
     # Follow the presigned URL to upload the file with a PUT request
+    # The open file is passed as the body so that it is streamed to the server
+    # in blocks instead of being read into memory all at once. The length must
+    # be given explicitly, otherwise urllib falls back to a chunked transfer
+    # encoding which the presigned URL doesn't accept.
     with open(file_path, "rb") as local_file:
+        headers = {
+            "Content-Type": "",
+            "Content-Length": str(os.fstat(local_file.fileno()).st_size),
+        }
         request = urllib.request.Request(
-            s3_url, data=local_file.read(), method="PUT", headers={"Content-Type": ""}
+            s3_url, data=local_file, method="PUT", headers=headers
         )
         with _get_url_response(request) as response:
-            logger.debug("Received response: %s", response.read().decode("utf-8"))
+            # Only read the response body when it is going to be logged
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Received response: %s", response.read().decode("utf-8"))
+
+
+def upload_many(
+    file_paths: Iterable[Union[Path, str]],
+    *,
+    api_key: Optional[str] = None,
+    max_workers: int = 8,
+) -> None:
+    """Upload multiple files to the data archive concurrently.
+
+    Each upload requests a presigned URL and then sends the file to it, so
+    uploading from a pool of threads overlaps these requests for the different
+    files rather than waiting for each file in turn.
+
+    Parameters
+    ----------
+    file_paths : iterable of pathlib.Path or str
+        Paths to the files to upload.
+    api_key : str, optional
+        API key to authenticate with the data access API. If not provided,
+        the value from the IMAP_API_KEY environment variable will be used.
+    max_workers : int, optional
+        Maximum number of files to upload at the same time
+
+    Raises
+    ------
+    IMAPDataAccessError
+        If any of the uploads failed. The other files are still uploaded.
+    """
+    _run_concurrently(
+        functools.partial(upload, api_key=api_key), file_paths, max_workers, "upload"
+    )
@@ -12,3 +12,5 @@ def _set_global_config(monkeypatch: pytest.fixture, tmp_path: pytest.fixture):
     monkeypatch.setitem(
         imap_data_access.config, "DATA_ACCESS_URL", "https://api.test.com"
     )
+    # Keep the query cache out of the user's cache directory
+    monkeypatch.setitem(imap_data_access.config, "QUERY_CACHE_DIR", tmp_path / "cache")
@@ -1,5 +1,9 @@
 """Tests for the CLI options."""
+# ruff: noqa: S603
+# subprocess call: check for execution of untrusted input
 
+import json
+import subprocess
 import sys
 from unittest import mock
 
@@ -14,3 +18,138 @@ def test_cli_works():
         # Should have a 0 SystemExit return code if successful
         with pytest.raises(SystemExit, match="0"):
             cli.main()
+
+
+def test_cli_import_is_lazy():
+    """Importing the CLI should not import the network or validation modules."""
+    command = [
+        sys.executable,
+        "-c",
+        "import sys; from imap_data_access import cli; "
+        "print(sorted(set(sys.modules) & "
+        "{'imap_data_access.io', 'imap_data_access.file_validation'}))",
+    ]
+    proc = subprocess.run(command, capture_output=True, check=True, text=True)
+    assert proc.stdout.strip() == "[]"
+
+
+def test_download_multiple_files(capsys):
+    """Test that multiple files can be downloaded in one call."""
+    file_paths = [
+        "imap_swe_l1_test_20100101_v000.cdf",
+        "imap_swe_l1_test_20100102_v000.cdf",
+    ]
+    argv = ["imap-data-access", "download", *file_paths]
+    with (
+        mock.patch.object(sys, "argv", argv),
+        mock.patch(
+            "imap_data_access.io.download", side_effect=lambda x, verify: x
+        ) as download,
+    ):
+        cli.main()
+
+    assert download.call_count == 2
+    assert capsys.readouterr().out.count("Successfully downloaded") == 2
+
+
+@pytest.mark.parametrize("option", ["-j", "--concurrency", "--max-conn"])
+def test_download_concurrency(option):
+    """Test that the number of concurrent downloads can be set."""
+    argv = ["imap-data-access", "download", option, "1", "a.bc", "b.bc"]
+    with (
+        mock.patch.object(sys, "argv", argv),
+        mock.patch("imap_data_access.download_many") as download_many,
+    ):
+        cli.main()
+
+    assert download_many.call_args.kwargs["max_workers"] == 1
+
+    # The default matches the download_many default
+    with (
+        mock.patch.object(sys, "argv", ["imap-data-access", "download", "a.bc"]),
+        mock.patch("imap_data_access.download_many") as download_many,
+    ):
+        cli.main()
+
+    assert download_many.call_args.kwargs["max_workers"] == 16
+
+
+def test_download_reports_failures(capsys):
+    """Test that a failed download is reported with a non-zero exit code."""
+    file_paths = ["good.bc", "bad.bc"]
+
+    def _download(file_path, verify):
+        if file_path.name == "bad.bc":
+            raise ValueError("Download failed")
+        return file_path
+
+    argv = ["imap-data-access", "download", *file_paths]
+    with (
+        mock.patch.object(sys, "argv", argv),
+        mock.patch("imap_data_access.io.download", side_effect=_download),
+    ):
+        # Should have a 1 SystemExit return code from the failed download
+        with pytest.raises(SystemExit, match="1"):
+            cli.main()
+    assert "Failed to download 1 of 2 files" in capsys.readouterr().err
+
+
+def test_print_query_results_table(capsys):
+    """Test that the query results table is sized to fit its contents."""
+    query_results = [
+        {
+            "file_path": "imap/swe/l1a/2010/01/imap_swe_l1a_sci_20100101_v001.cdf",
+            "instrument": "swe",
+            "data_level": "l1a",
+            "descriptor": "sci",
+            "start_date": "20100101",
+            "repointing": None,
+            "version": "v001",
+        },
+        {
+            "file_path": "imap/mag/l1a/2010/01/imap_mag_l1a_a-long-descriptor_"
+            "20100101-repoint00001_v001.cdf",
+            "instrument": "mag",
+            "data_level": "l1a",
+            "descriptor": "a-long-descriptor",
+            "start_date": "20100101",
+            "repointing": 1,
+            "version": "v001",
+        },
+    ]
+    cli._print_query_results_table(query_results)
+    lines = capsys.readouterr().out.splitlines()
+
+    assert lines[0] == "Found [2] matching files"
+    # Header, data rows, and separators all line up
+    table = lines[1:]
+    assert len(table) == 6
+    assert len({len(line) for line in table}) == 1
+    assert table[1].split("|")[3].strip() == "Descriptor"
+    assert table[4].split("|")[3].strip() == "a-long-descriptor"
+    assert table[3].split("|")[-2].strip() == ("imap_swe_l1a_sci_20100101_v001.cdf")
+
+
+def test_print_query_results_table_empty(capsys):
+    """Test that no table is printed when there are no results."""
+    cli._print_query_results_table([])
+    assert capsys.readouterr().out == "Found [0] matching files\n"
+
+
+def test_query_json_output(capsys):
+    """Test that the json output format prints valid JSON."""
+    query_results = [
+        {
+            "file_path": "imap/swe/l1a/2010/01/imap_swe_l1a_sci_20100101_v001.cdf",
+            "instrument": "swe",
+            "repointing": None,
+        }
+    ]
+    argv = ["imap-data-access", "query", "--instrument", "swe", "--output-format"]
+    with (
+        mock.patch.object(sys, "argv", [*argv, "json"]),
+        mock.patch("imap_data_access.query", return_value=query_results),
+    ):
+        cli.main()
+
+    assert json.loads(capsys.readouterr().out) == query_results
@@ -48,3 +48,21 @@ def test_configuration_updates(config_var, default, expected):
         text=True,
     )
     assert proc.stdout.strip() == expected
+
+
+def test_relative_data_dir_is_resolved():
+    """Test that a relative data directory is resolved once at import."""
+    command = [
+        sys.executable,
+        "-c",
+        "import os, imap_data_access; os.chdir('/'); "
+        "print(imap_data_access.config['DATA_DIR'])",
+    ]
+    proc = subprocess.run(
+        command,
+        env={**os.environ, "IMAP_DATA_DIR": "relative/data"},
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert proc.stdout.strip() == str(Path.cwd().resolve() / "relative" / "data")
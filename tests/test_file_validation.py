@@ -54,11 +54,20 @@ def test_extract_filename_components():
     assert (
         ScienceFilePath.extract_filename_components(valid_filepath) == expected_output
     )
+    # Directories in a string path are ignored as well
+    assert (
+        ScienceFilePath.extract_filename_components(str(valid_filepath))
+        == expected_output
+    )
 
     invalid_ext = "imap_mag_l1a_burst_20210101_v001.txt"
     with pytest.raises(ScienceFilePath.InvalidScienceFileError):
         ScienceFilePath.extract_filename_components(invalid_ext)
 
+    trailing_newline = "imap_mag_l1a_burst_20210101_v001.cdf\n"
+    with pytest.raises(ScienceFilePath.InvalidScienceFileError):
+        ScienceFilePath.extract_filename_components(trailing_newline)
+
 
 def test_construct_sciencefilepathmanager():
     """Tests that the ``ScienceFilePath`` class constructs a valid filename."""
@@ -120,6 +129,24 @@ def test_is_valid_date():
     invalid_date = "2021010"
     assert not ScienceFilePath.is_valid_date(invalid_date)
 
+    # Leap years
+    assert ScienceFilePath.is_valid_date("20240229")
+    assert ScienceFilePath.is_valid_date("20000229")
+    assert not ScienceFilePath.is_valid_date("20230229")
+    assert not ScienceFilePath.is_valid_date("21000229")
+
+    # Out of range months and days
+    assert not ScienceFilePath.is_valid_date("20210001")
+    assert not ScienceFilePath.is_valid_date("20211301")
+    assert not ScienceFilePath.is_valid_date("20210100")
+    assert not ScienceFilePath.is_valid_date("20210431")
+
+    # Only ASCII digits are allowed
+    assert not ScienceFilePath.is_valid_date("2021 101")
+    assert not ScienceFilePath.is_valid_date(
+        "\uff12\uff10\uff12\uff11\uff10\uff11\uff10\uff11"
+    )
+
 
 def test_construct_upload_path():
     """Tests the ``construct_path`` method."""
@@ -131,6 +158,14 @@ def test_construct_upload_path():
 
     assert sfm.construct_path() == expected_output
 
+    # Any directories on the input are replaced by the standard structure
+    for filename in [f"a/b/{valid_filename}", Path("a/b") / valid_filename]:
+        sfm = ScienceFilePath(filename)
+        assert sfm.filename == Path(valid_filename)
+        assert sfm.construct_path() == expected_output
+
+    assert sfm.relative_path == "imap/mag/l1a/2021/01/" + valid_filename
+
 
 def test_generate_from_inputs():
     """Tests the ``generate_from_inputs`` method."""
@@ -177,7 +212,53 @@ def test_spice_file_path():
     assert file_path.construct_path() == imap_data_access.config["DATA_DIR"] / Path(
         "spice/ck/test.bc"
     )
+    assert file_path.relative_path == "spice/ck/test.bc"
 
     # Test a bad file extension too
     with pytest.raises(SPICEFilePath.InvalidSPICEFileError):
         SPICEFilePath("test.txt")
+
+
+@pytest.mark.parametrize(
+    ("filename", "valid"),
+    [
+        ("imap_mag_l1a_burst_20210101_v001.cdf", True),
+        ("imap_hit_l0_raw_20210101-repoint00001_v001.pkts", True),
+        ("imap_hi_l1ca_burst-1min_20240229_v999.cdf", True),
+        # Wrong extension for the data level
+        ("imap_mag_l0_raw_20210101_v001.cdf", False),
+        ("imap_mag_l1a_burst_20210101_v001.pkts", False),
+        # Invalid date
+        ("imap_mag_l1a_burst_20210229_v001.cdf", False),
+        # Invalid instrument and data level
+        ("imap_foo_l1a_burst_20210101_v001.cdf", False),
+        ("imap_mag_l9_burst_20210101_v001.cdf", False),
+    ],
+)
+def test_validation_matches_full_validation(filename, valid):
+    """Test that the quick validation of valid filenames agrees with the full one."""
+    if valid:
+        sfm = ScienceFilePath(filename)
+        assert sfm.error_message == ""
+        assert sfm.validate_filename() == ""
+    else:
+        with pytest.raises(ScienceFilePath.InvalidScienceFileError, match="Invalid"):
+            ScienceFilePath(filename)
+
+
+def test_from_name(monkeypatch, tmp_path):
+    """Tests that ``from_name`` reuses instances for the same data directory."""
+    valid_filename = "imap_mag_l1a_burst_20210101_v001.cdf"
+    sfm = ScienceFilePath.from_name(valid_filename)
+    assert sfm.instrument == "mag"
+    assert ScienceFilePath.from_name(valid_filename) is sfm
+
+    # A new data directory should give a new instance with the new path
+    new_data_dir = tmp_path / "new"
+    monkeypatch.setitem(imap_data_access.config, "DATA_DIR", new_data_dir)
+    new_sfm = ScienceFilePath.from_name(valid_filename)
+    assert new_sfm is not sfm
+    assert new_sfm.construct_path().is_relative_to(new_data_dir)
+
+    with pytest.raises(ScienceFilePath.InvalidScienceFileError):
+        ScienceFilePath.from_name("imap_mag_l1a_burst_20210101_v001.txt")
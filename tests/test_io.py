@@ -10,7 +10,6 @@ from io import BytesIO
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 from urllib.error import HTTPError, URLError
-from urllib.parse import urlencode
 from urllib.request import Request
 
 import pytest
@@ -33,8 +32,7 @@ def mock_urlopen():
     """
     mock_data = b"Mock file content"
     with patch("urllib.request.urlopen") as mock_urlopen:
-        mock_response = mock_urlopen.return_value.__enter__.return_value
-        mock_response.read.return_value = mock_data
+        _set_mock_data(mock_urlopen, mock_data)
         yield mock_urlopen
 
 
@@ -48,8 +46,52 @@ def _set_mock_data(mock_urlopen: unittest.mock.MagicMock, data: bytes):
     data : bytes
         The mock data
     """
-    mock_response = mock_urlopen.return_value.__enter__.return_value
-    mock_response.read.return_value = data
+    # Every request gets its own response, so the data can be read
+    # in chunks and multiple requests each get all of the data
+    mock_urlopen.side_effect = lambda request: _FakeResponse(data)
+
+
+class _FakeResponse(BytesIO):
+    """Lightweight stand-in for the response returned by ``urlopen``.
+
+    A plain file-like object is much cheaper to create than a chain of
+    ``MagicMock`` children, and reads behave like a real response.
+
+    Parameters
+    ----------
+    data : bytes
+        The body of the response
+    headers : dict, optional
+        The headers of the response
+    """
+
+    def __init__(self, data: bytes = b"", headers: dict | None = None):
+        super().__init__(data)
+        self.headers = headers or {}
+
+    def getcode(self) -> int:
+        """Return the HTTP status code of the response."""
+        return 200
+
+
+def _sent_requests(mock_urlopen: unittest.mock.MagicMock) -> list[Request]:
+    """Get the requests that were passed to the mock urlopen.
+
+    Parameters
+    ----------
+    mock_urlopen : unittest.mock.MagicMock
+        Mock object for ``urlopen``
+
+    Returns
+    -------
+    list of urllib.request.Request
+        The requests, in the order they were sent
+    """
+    return [
+        call.args[0]
+        for call in mock_urlopen.call_args_list
+        if call.args and isinstance(call.args[0], Request)
+    ]
 
 
 @patch("urllib.request.urlopen")
@@ -73,8 +115,7 @@ def test_redirect_followed(mock_urlopen):
     )
 
     # Mocking the second response (200 OK)
-    mock_success_response = MagicMock()
-    mock_success_response.__enter__.return_value.getcode.return_value = 200
+    mock_success_response = _FakeResponse()
 
     # Using side_effect to alternate between 307 and 200 responses
     mock_urlopen.side_effect = [mock_error_response, mock_success_response]
@@ -105,26 +146,111 @@ def test_request_errors(mock_urlopen: unittest.mock.MagicMock):
     mock_urlopen.side_effect = URLError(reason="Not Found")
     with pytest.raises(imap_data_access.io.IMAPDataAccessError, match="URL Error"):
         imap_data_access.download(test_science_path)
+    # Client errors aren't retried
+    assert mock_urlopen.call_count == 2
+
+
+@patch("time.sleep")
+def test_request_retries(
+    mock_sleep: unittest.mock.MagicMock, mock_urlopen: unittest.mock.MagicMock
+):
+    """Test that GET requests are retried on transient errors.
+
+    Parameters
+    ----------
+    mock_sleep : unittest.mock.MagicMock
+        Mock object for ``time.sleep``
+    mock_urlopen : unittest.mock.MagicMock
+        Mock object for ``urlopen``
+    """
+
+    def _unavailable():
+        return HTTPError(
+            url="http://example.com",
+            code=503,
+            msg="Service Unavailable",
+            hdrs={},
+            fp=BytesIO(b"Try again later"),
+        )
+
+    # A dropped connection and a 503 are retried before the request succeeds
+    unavailable = _unavailable()
+    mock_urlopen.side_effect = [
+        URLError(reason=ConnectionResetError()),
+        unavailable,
+        _FakeResponse(b"Mock file content"),
+    ]
+    destination = imap_data_access.download(test_science_path)
+    assert destination.read_bytes() == b"Mock file content"
+    assert mock_urlopen.call_count == 3
+    # The failed response is closed before trying again
+    assert unavailable.fp.closed
+    # The delay backs off exponentially with up to a second of jitter
+    delays = [call.args[0] for call in mock_sleep.call_args_list]
+    assert len(delays) == 2
+    assert 0.5 <= delays[0] < 1.5
+    assert 1 <= delays[1] < 2
+
+    # Uploads aren't idempotent, so they are never retried
+    mock_urlopen.reset_mock()
+    mock_urlopen.side_effect = [
+        _FakeResponse(b'"https://s3-test-bucket.com"'),
+        _unavailable(),
+    ]
+    with pytest.raises(imap_data_access.io.IMAPDataAccessError, match="HTTP Error"):
+        imap_data_access.upload(destination)
+    assert mock_urlopen.call_count == 2
+
+    # Eventually the request gives up
+    destination.unlink()
+    mock_urlopen.reset_mock()
+    mock_sleep.reset_mock()
+    mock_urlopen.side_effect = [
+        _unavailable() for _ in range(imap_data_access.io._RETRY_ATTEMPTS + 1)
+    ]
+    with pytest.raises(imap_data_access.io.IMAPDataAccessError, match="HTTP Error"):
+        imap_data_access.download(test_science_path)
+    assert mock_urlopen.call_count == imap_data_access.io._RETRY_ATTEMPTS + 1
+    # but the delay never grows beyond the maximum
+    assert max(call.args[0] for call in mock_sleep.call_args_list) <= (
+        imap_data_access.io._RETRY_MAX_DELAY
+    )
 
 
 @pytest.mark.parametrize(
-    ("file_path", "destination"),
+    ("file_path", "destination", "expected_url"),
     [
         # Directory structure inferred
         (
             test_science_filename,
             test_science_path,
+            f"https://api.test.com/download/{test_science_path}",
         ),
         # Directory structure provided in the request
-        (test_science_path, test_science_path),
+        (
+            test_science_path,
+            test_science_path,
+            f"https://api.test.com/download/{test_science_path}",
+        ),
         # Pathlib.Path object
-        (Path(test_science_path), test_science_path),
+        (
+            Path(test_science_path),
+            test_science_path,
+            f"https://api.test.com/download/{test_science_path}",
+        ),
         # SPICE file
-        ("test.bc", "spice/ck/test.bc"),
+        (
+            "test.bc",
+            "spice/ck/test.bc",
+            "https://api.test.com/download/spice/ck/test.bc",
+        ),
     ],
 )
 def test_download(
-    mock_urlopen: unittest.mock.MagicMock, file_path: str | Path, destination: str
+    mock_urlopen: unittest.mock.MagicMock,
+    file_path: str | Path,
+    destination: str,
+    expected_url: str,
 ):
     """Test that the download API works as expected.
 
@@ -136,6 +262,8 @@ def test_download(
         The path to the file to download
     destination : str
         The path to which the file is expected to be downloaded
+    expected_url : str
+        The URL the file is expected to be requested from
     """
     # Call the download function
     result = imap_data_access.download(file_path)
@@ -146,22 +274,19 @@ def test_download(
     expected_destination = imap_data_access.config["DATA_DIR"] / destination
     assert result == expected_destination
 
-    # Assert that the file content matches the mock data
+    # Assert that the file content matches the mock data, reading at most one
+    # byte more than expected so a much larger file isn't read into memory
+    expected = b"Mock file content"
     with open(result, "rb") as f:
-        assert f.read() == b"Mock file content"
+        assert f.read(len(expected) + 1) == expected
 
     # Should have only been one call to urlopen
     mock_urlopen.assert_called_once()
 
     # Assert that the correct URL was used for the download
-    urlopen_calls = mock_urlopen.mock_calls
-    # Check the arguments passed to urlopen
-    # We pass a Request object, so need to get that with args[0]
-    request_sent = urlopen_calls[0].args[0]
-    called_url = request_sent.full_url
+    request_sent = _sent_requests(mock_urlopen)[0]
     # url should be provided as path parameters
-    expected_url_encoded = f"https://api.test.com/download/{destination}"
-    assert called_url == expected_url_encoded
+    assert request_sent.full_url == expected_url
     assert request_sent.method == "GET"
 
 
@@ -184,33 +309,262 @@ def test_download_already_exists(mock_urlopen: unittest.mock.MagicMock):
     assert mock_urlopen.call_count == 0
 
 
+def test_download_verify(mock_urlopen: unittest.mock.MagicMock):
+    """Test that existing files are checked against the archive when verifying.
+
+    Parameters
+    ----------
+    mock_urlopen : unittest.mock.MagicMock
+        Mock object for ``urlopen``
+    """
+    destination = imap_data_access.config["DATA_DIR"] / test_science_path
+    etag_file = destination.with_name(destination.name + ".etag")
+    mock_urlopen.side_effect = lambda request: _FakeResponse(
+        b"Mock file content", {"Content-Length": "17", "ETag": '"abc"'}
+    )
+
+    # The ETag is stored alongside a new download
+    imap_data_access.download(test_science_path, verify=True)
+    assert etag_file.read_text() == '"abc"'
+    mock_urlopen.assert_called_once()
+
+    # Files with an ETag are requested with a conditional GET
+    mock_urlopen.reset_mock()
+    imap_data_access.download(test_science_path, verify=True)
+    mock_urlopen.assert_called_once()
+    request_sent = mock_urlopen.call_args.args[0]
+    assert request_sent.method == "GET"
+    assert request_sent.headers["If-none-match"] == '"abc"'
+
+    # Without an ETag, only a HEAD request is made if the size matches
+    etag_file.unlink()
+    mock_urlopen.reset_mock()
+    assert imap_data_access.download(test_science_path, verify=True) == destination
+    mock_urlopen.assert_called_once()
+    assert mock_urlopen.call_args.args[0].method == "HEAD"
+
+    # A different size causes the file to be downloaded again
+    destination.write_bytes(b"Corrupt")
+    mock_urlopen.reset_mock()
+    imap_data_access.download(test_science_path, verify=True)
+    assert [request.method for request in _sent_requests(mock_urlopen)] == [
+        "HEAD",
+        "GET",
+    ]
+    assert destination.read_bytes() == b"Mock file content"
+    assert etag_file.read_text() == '"abc"'
+
+    # Without verifying no requests are made
+    mock_urlopen.reset_mock()
+    imap_data_access.download(test_science_path)
+    assert mock_urlopen.call_count == 0
+
+    # and the ETag isn't stored for new downloads
+    destination.unlink()
+    etag_file.unlink()
+    imap_data_access.download(test_science_path)
+    assert destination.exists()
+    assert not etag_file.exists()
+
+
+def test_download_verify_head_rejected(mock_urlopen: unittest.mock.MagicMock):
+    """Test that the file is downloaded again if the HEAD request fails.
+
+    Parameters
+    ----------
+    mock_urlopen : unittest.mock.MagicMock
+        Mock object for ``urlopen``
+    """
+    destination = imap_data_access.config["DATA_DIR"] / test_science_path
+    destination.parent.mkdir(parents=True)
+    destination.write_bytes(b"Existing content")
+
+    def _urlopen(request):
+        if request.method == "HEAD":
+            # Presigned URLs are only valid for the method they were signed for
+            raise HTTPError(
+                url=request.full_url, code=403, msg="Forbidden", hdrs={}, fp=BytesIO()
+            )
+        return _FakeResponse(b"Mock file content")
+
+    mock_urlopen.side_effect = _urlopen
+    assert imap_data_access.download(test_science_path, verify=True) == destination
+    assert [request.method for request in _sent_requests(mock_urlopen)] == [
+        "HEAD",
+        "GET",
+    ]
+    assert destination.read_bytes() == b"Mock file content"
+
+
+def test_download_not_modified(mock_urlopen: unittest.mock.MagicMock):
+    """Test that a 304 response to a conditional GET keeps the existing file.
+
+    Parameters
+    ----------
+    mock_urlopen : unittest.mock.MagicMock
+        Mock object for ``urlopen``
+    """
+    destination = imap_data_access.config["DATA_DIR"] / test_science_path
+    destination.parent.mkdir(parents=True)
+    destination.write_bytes(b"Existing content")
+    destination.with_name(destination.name + ".etag").write_text('"abc"')
+    mock_urlopen.side_effect = HTTPError(
+        url="http://example.com", code=304, msg="Not Modified", hdrs={}, fp=None
+    )
+
+    assert imap_data_access.download(test_science_path, verify=True) == destination
+    assert destination.read_bytes() == b"Existing content"
+    request_sent = mock_urlopen.call_args.args[0]
+    assert request_sent.headers["If-none-match"] == '"abc"'
+
+
+def test_download_local_mirror(
+    mock_urlopen: unittest.mock.MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+):
+    """Test that files are copied directly from a local mirror of the archive.
+
+    Parameters
+    ----------
+    mock_urlopen : unittest.mock.MagicMock
+        Mock object for ``urlopen``
+    monkeypatch : pytest.MonkeyPatch
+        Fixture to point the data access URL at the local mirror
+    tmp_path : pathlib.Path
+        Temporary directory to create the local mirror in
+    """
+    mirror = tmp_path / "mirror"
+    source = mirror / "download" / test_science_path
+    source.parent.mkdir(parents=True)
+    source.write_bytes(b"Mirrored file content")
+    monkeypatch.setitem(imap_data_access.config, "DATA_ACCESS_URL", mirror.as_uri())
+
+    result = imap_data_access.download(test_science_path)
+    assert result == imap_data_access.config["DATA_DIR"] / test_science_path
+    assert result.read_bytes() == b"Mirrored file content"
+    assert mock_urlopen.call_count == 0
+
+    # Missing files raise the same error as from the archive
+    with pytest.raises(imap_data_access.io.IMAPDataAccessError, match="URL Error"):
+        imap_data_access.download(test_science_path.replace("v000", "v001"))
+
+
+def test_download_interrupted(mock_urlopen: unittest.mock.MagicMock):
+    """Test that a partially downloaded file is removed if the download fails.
+
+    Parameters
+    ----------
+    mock_urlopen : unittest.mock.MagicMock
+        Mock object for ``urlopen``
+    """
+
+    def _interrupted_response(request):
+        response = _FakeResponse()
+        response.read = MagicMock(
+            side_effect=[b"partial", ConnectionResetError("reset")]
+        )
+        return response
+
+    mock_urlopen.side_effect = _interrupted_response
+
+    with pytest.raises(ConnectionResetError):
+        imap_data_access.download(test_science_path)
+    destination = imap_data_access.config["DATA_DIR"] / test_science_path
+    assert not destination.exists()
+    assert list(destination.parent.iterdir()) == []
+
+    # A file that is being downloaded again is kept if the download fails
+    destination.write_bytes(b"Existing content")
+    with pytest.raises(ConnectionResetError):
+        imap_data_access.download(test_science_path, verify=True)
+    assert destination.read_bytes() == b"Existing content"
+    assert list(destination.parent.iterdir()) == [destination]
+
+
+def test_download_many(mock_urlopen: unittest.mock.MagicMock):
+    """Test that multiple files can be downloaded at once.
+
+    Parameters
+    ----------
+    mock_urlopen : unittest.mock.MagicMock
+        Mock object for ``urlopen``
+    """
+    file_paths = [test_science_filename, "test.bc", "test.tsc"]
+    results = imap_data_access.download_many(file_paths, max_workers=2)
+
+    data_dir = imap_data_access.config["DATA_DIR"]
+    assert results == [
+        data_dir / test_science_path,
+        data_dir / "spice/ck/test.bc",
+        data_dir / "spice/sclk/test.tsc",
+    ]
+    assert all(result.exists() for result in results)
+    assert mock_urlopen.call_count == 3
+    called_urls = {request.full_url for request in _sent_requests(mock_urlopen)}
+    assert called_urls == {
+        "https://api.test.com/download/imap/swe/l1/2010/01/" + test_science_filename,
+        "https://api.test.com/download/spice/ck/test.bc",
+        "https://api.test.com/download/spice/sclk/test.tsc",
+    }
+
+
+def test_download_many_errors(mock_urlopen: unittest.mock.MagicMock):
+    """Test that failed downloads are reported after the others finish.
+
+    Parameters
+    ----------
+    mock_urlopen : unittest.mock.MagicMock
+        Mock object for ``urlopen``
+    """
+    with pytest.raises(
+        imap_data_access.io.IMAPDataAccessError, match="Failed to download 1 of 2"
+    ):
+        imap_data_access.download_many(["test.bc", "bad-file.txt"])
+    # The good file should still have been downloaded
+    assert (imap_data_access.config["DATA_DIR"] / "spice/ck/test.bc").exists()
+    assert mock_urlopen.call_count == 1
+
+
 @pytest.mark.parametrize(
-    "query_params",
+    ("query_params", "expected_url"),
     [
         # All parameters should send full query
-        {
-            "instrument": "swe",
-            "data_level": "l0",
-            "descriptor": "test-description",
-            "start_date": "20100101",
-            "end_date": "20100102",
-            "repointing": "repoint00001",
-            "version": "v000",
-            "extension": "pkts",
-        },
+        (
+            {
+                "instrument": "swe",
+                "data_level": "l0",
+                "descriptor": "test-description",
+                "start_date": "20100101",
+                "end_date": "20100102",
+                "repointing": "repoint00001",
+                "version": "v000",
+                "extension": "pkts",
+            },
+            "https://api.test.com/query?instrument=swe&data_level=l0"
+            "&descriptor=test-description&start_date=20100101&end_date=20100102"
+            "&repointing=repoint00001&version=v000&extension=pkts",
+        ),
         # Make sure not all query params are sent if they are missing
-        {"instrument": "swe", "data_level": "l0"},
+        (
+            {"instrument": "swe", "data_level": "l0"},
+            "https://api.test.com/query?instrument=swe&data_level=l0",
+        ),
     ],
 )
-def test_query(mock_urlopen: unittest.mock.MagicMock, query_params: list[dict]):
+def test_query(
+    mock_urlopen: unittest.mock.MagicMock, query_params: dict, expected_url: str
+):
     """Test a basic call to the Query API.
 
     Parameters
     ----------
     mock_urlopen : unittest.mock.MagicMock
         Mock object for ``urlopen``
-    query_params : list of dict
-        A list of key/value pairs that set the query parameters
+    query_params : dict
+        Key/value pairs that set the query parameters
+    expected_url : str
+        The URL the query is expected to be sent to
     """
     _set_mock_data(mock_urlopen, json.dumps([]).encode("utf-8"))
     response = imap_data_access.query(**query_params)
@@ -220,10 +574,111 @@ def test_query(mock_urlopen: unittest.mock.MagicMock, query_params: list[dict]):
     # Should have only been one call to urlopen
     mock_urlopen.assert_called_once()
     # Assert that the correct URL was used for the query
-    urlopen_call = mock_urlopen.mock_calls[0].args[0]
-    called_url = urlopen_call.full_url
-    expected_url_encoded = f"https://api.test.com/query?{urlencode(query_params)}"
-    assert called_url == expected_url_encoded
+    assert _sent_requests(mock_urlopen)[0].full_url == expected_url
+
+
+def test_query_latest_version(mock_urlopen: unittest.mock.MagicMock):
+    """Test that only the files with the latest version are returned.
+
+    Parameters
+    ----------
+    mock_urlopen : unittest.mock.MagicMock
+        Mock object for ``urlopen``
+    """
+    items = [
+        {"file_path": "a", "version": "v001"},
+        {"file_path": "b", "version": "v003"},
+        {"file_path": "c", "version": "v002"},
+        {"file_path": "d", "version": "v003"},
+    ]
+    _set_mock_data(mock_urlopen, json.dumps(items).encode("utf-8"))
+    response = imap_data_access.query(instrument="swe", version="latest")
+    assert response == [items[1], items[3]]
+
+    # The version isn't sent to the server
+    called_url = _sent_requests(mock_urlopen)[0].full_url
+    assert called_url == "https://api.test.com/query?instrument=swe"
+
+
+def test_query_cache(
+    mock_urlopen: unittest.mock.MagicMock, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that query responses are cached on disk when enabled.
+
+    Parameters
+    ----------
+    mock_urlopen : unittest.mock.MagicMock
+        Mock object for ``urlopen``
+    monkeypatch : pytest.MonkeyPatch
+        Fixture to enable the query cache
+    """
+    items = [{"file_path": test_science_path, "version": "v001"}]
+    _set_mock_data(mock_urlopen, json.dumps(items).encode("utf-8"))
+
+    # Caching is disabled by default
+    imap_data_access.query(instrument="swe")
+    imap_data_access.query(instrument="swe")
+    assert mock_urlopen.call_count == 2
+    assert not imap_data_access.config["QUERY_CACHE_DIR"].exists()
+
+    monkeypatch.setitem(imap_data_access.config, "QUERY_CACHE_TTL", 300)
+    mock_urlopen.reset_mock()
+    assert imap_data_access.query(instrument="swe") == items
+    assert imap_data_access.query(instrument="swe") == items
+    mock_urlopen.assert_called_once()
+
+    # The decoded response is reused, and changes to it aren't cached
+    hits = imap_data_access.io._load_query_cache.cache_info().hits
+    imap_data_access.query(instrument="swe")[0]["version"] = "v002"
+    assert imap_data_access.query(instrument="swe") == items
+    assert imap_data_access.io._load_query_cache.cache_info().hits == hits + 2
+
+    # Different parameters are cached separately
+    imap_data_access.query(instrument="mag")
+    assert mock_urlopen.call_count == 2
+
+    # The cache can be bypassed
+    imap_data_access.query(instrument="swe", use_cache=False)
+    assert mock_urlopen.call_count == 3
+
+    # Expired responses are requested again
+    for cache_file in imap_data_access.config["QUERY_CACHE_DIR"].iterdir():
+        os.utime(cache_file, (0, 0))
+    imap_data_access.query(instrument="swe")
+    assert mock_urlopen.call_count == 4
+
+    # The TTL can be given as a string, e.g. from the environment
+    monkeypatch.setitem(imap_data_access.config, "QUERY_CACHE_TTL", "300")
+    imap_data_access.query(instrument="swe")
+    assert mock_urlopen.call_count == 4
+
+    monkeypatch.setitem(imap_data_access.config, "QUERY_CACHE_TTL", "5m")
+    with pytest.raises(ValueError, match="Not a valid QUERY_CACHE_TTL '5m'"):
+        imap_data_access.query(instrument="swe")
+    # Bypassing the cache doesn't need a valid TTL
+    imap_data_access.query(instrument="swe", use_cache=False)
+    assert mock_urlopen.call_count == 5
+
+
+def test_query_cache_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    """Test the default location of the query cache.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        Fixture to set the cache location
+    tmp_path : pathlib.Path
+        Temporary directory for the cache
+    """
+    monkeypatch.setitem(imap_data_access.config, "QUERY_CACHE_DIR", None)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    cache_file = imap_data_access.io._query_cache_file("https://api.test.com/query")
+    assert cache_file.parent == tmp_path / "imap_data_access" / "queries"
+
+    # Without a home directory queries aren't cached
+    monkeypatch.delenv("XDG_CACHE_HOME")
+    with patch("pathlib.Path.home", side_effect=RuntimeError("No home directory")):
+        assert imap_data_access.io._query_cache_file("https://api.test.com") is None
 
 
 def test_query_no_params(mock_urlopen: unittest.mock.MagicMock):
@@ -262,13 +717,13 @@ def test_query_bad_params(mock_urlopen: unittest.mock.MagicMock):
             "instrument",
             "badInput",
             "Not a valid instrument, please choose from "
-            + ", ".join(imap_data_access.VALID_INSTRUMENTS),
+            + ", ".join(sorted(imap_data_access.VALID_INSTRUMENTS)),
         ),
         (
             "data_level",
             "badInput",
             "Not a valid data level, choose from "
-            + ", ".join(imap_data_access.VALID_DATALEVELS),
+            + ", ".join(sorted(imap_data_access.VALID_DATALEVELS)),
         ),
         ("start_date", "badInput", "Not a valid start date, use format 'YYYYMMDD'."),
         ("end_date", "badInput", "Not a valid end date, use format 'YYYYMMDD'."),
@@ -307,6 +762,16 @@ def test_bad_query_input(query_flag, query_input, expected_output):
         imap_data_access.query(**kwargs)
 
 
+def test_bad_query_input_order():
+    """Test which error is reported when several query inputs are invalid."""
+    with pytest.raises(ValueError, match="Not a valid version"):
+        imap_data_access.query(instrument="mag", repointing="bad", version="bad")
+    with pytest.raises(ValueError, match="Not a valid instrument"):
+        imap_data_access.query(extension="bad", instrument="bad")
+    with pytest.raises(ValueError, match="Not a valid start date"):
+        imap_data_access.query(end_date="bad", start_date="bad", extension="bad")
+
+
 def test_upload_no_file(mock_urlopen: unittest.mock.MagicMock):
     """Test a call to the upload API that has no filename supplied.
 
@@ -332,6 +797,7 @@ def test_upload_no_file(mock_urlopen: unittest.mock.MagicMock):
 )
 def test_upload(
     mock_urlopen: unittest.mock.MagicMock,
+    monkeypatch: pytest.MonkeyPatch,
     upload_file_path: str | Path,
     api_key: str | None,
     expected_header: dict,
@@ -342,6 +808,8 @@ def test_upload(
     ----------
     mock_urlopen : unittest.mock.MagicMock
         Mock object for ``urlopen``
+    monkeypatch : pytest.MonkeyPatch
+        Fixture to change the working directory for the test
     upload_file_path : str or Path
         The upload file path to test with
     api_key : str or None
@@ -357,7 +825,9 @@ def test_upload(
         f.write(b"test file content")
     assert file_to_upload.exists()
 
-    os.chdir(imap_data_access.config["DATA_DIR"])
+    # Relative paths are relative to the working directory, only the
+    # name of the file is used for the upload
+    monkeypatch.chdir(imap_data_access.config["DATA_DIR"])
     imap_data_access.upload(upload_file_path, api_key=api_key)
 
     # Should have been two calls to urlopen
@@ -365,17 +835,10 @@ def test_upload(
     # 2. To upload the file to the url returned in 1.
     assert mock_urlopen.call_count == 2
 
-    # We get all returned calls, but we only need the calls
-    # where we sent requests
-    mock_calls = [
-        call
-        for call in mock_urlopen.mock_calls
-        if len(call.args) and isinstance(call.args[0], Request)
-    ]
+    requests_sent = _sent_requests(mock_urlopen)
 
     # First urlopen call should be to get the s3 upload url
-    urlopen_call = mock_calls[0]
-    request_sent = urlopen_call.args[0]
+    request_sent = requests_sent[0]
     called_url = request_sent.full_url
     expected_url_encoded = "https://api.test.com/upload/test-file.txt"
     assert called_url == expected_url_encoded
@@ -384,12 +847,85 @@ def test_upload(
     assert request_sent.headers == expected_header
 
     # Verify that we put that response into our second request
-    urlopen_call = mock_calls[1]
-    request_sent = urlopen_call.args[0]
+    request_sent = requests_sent[1]
     called_url = request_sent.full_url
     expected_url_encoded = "https://s3-test-bucket.com"
     assert called_url == expected_url_encoded
     assert request_sent.method == "PUT"
 
-    # Assert that the original data from the test file was sent
-    assert request_sent.data == b"test file content"
+    # Assert that the test file was streamed as the body with its length
+    assert request_sent.data.name == str(file_to_upload.resolve())
+    assert request_sent.headers["Content-length"] == str(len(b"test file content"))
+
+
+def test_upload_redirect(mock_urlopen: unittest.mock.MagicMock):
+    """Test that the whole file is sent again when an upload is redirected.
+
+    Parameters
+    ----------
+    mock_urlopen : unittest.mock.MagicMock
+        Mock object for ``urlopen``
+    """
+    file_to_upload = imap_data_access.config["DATA_DIR"] / "test-file.txt"
+    file_to_upload.write_bytes(b"test file content")
+    bodies = []
+
+    def _urlopen(request):
+        if request.method == "GET":
+            return _FakeResponse(b'"https://s3-test-bucket.com"')
+        # Read the body like the server would
+        bodies.append(request.data.read())
+        if len(bodies) == 1:
+            raise HTTPError(
+                url=request.full_url,
+                code=307,
+                msg="Temporary Redirect",
+                hdrs={"Location": "https://s3-redirected-bucket.com"},
+                fp=None,
+            )
+        return _FakeResponse()
+
+    mock_urlopen.side_effect = _urlopen
+    imap_data_access.upload(file_to_upload)
+
+    assert _sent_requests(mock_urlopen)[-1].full_url == (
+        "https://s3-redirected-bucket.com"
+    )
+    assert bodies == [b"test file content", b"test file content"]
+
+
+def test_upload_many(mock_urlopen: unittest.mock.MagicMock):
+    """Test that multiple files can be uploaded at once.
+
+    Parameters
+    ----------
+    mock_urlopen : unittest.mock.MagicMock
+        Mock object for ``urlopen``
+    """
+    _set_mock_data(mock_urlopen, b'"https://s3-test-bucket.com"')
+    file_paths = []
+    for name in ["a.txt", "b.txt", "c.txt"]:
+        file_path = imap_data_access.config["DATA_DIR"] / name
+        file_path.write_bytes(b"test file content")
+        file_paths.append(file_path)
+
+    imap_data_access.upload_many(file_paths, api_key="test-api-key", max_workers=2)
+
+    # A presigned URL request and an upload for each file
+    requests = _sent_requests(mock_urlopen)
+    assert sorted(
+        request.full_url for request in requests if request.method == "GET"
+    ) == [
+        "https://api.test.com/upload/a.txt",
+        "https://api.test.com/upload/b.txt",
+        "https://api.test.com/upload/c.txt",
+    ]
+    assert [request.method for request in requests].count("PUT") == 3
+
+    # Missing files are reported after the others are uploaded
+    mock_urlopen.reset_mock()
+    with pytest.raises(
+        imap_data_access.io.IMAPDataAccessError, match="Failed to upload 1 of 2"
+    ):
+        imap_data_access.upload_many([file_paths[0], "missing.txt"])
+    assert mock_urlopen.call_count == 2